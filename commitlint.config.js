@@ -1,4 +1,11 @@
 module.exports = {
+    // Allow a `[<request id>] ' prefix before the conventional `type(scope): subject' header
+    parserPreset: {
+        parserOpts: {
+            headerPattern: /^(?:\[[^\]]+\] )?(\w*)(?:\((.*)\))?!?: (.*)$/,
+            headerCorrespondence: ['type', 'scope', 'subject'],
+        },
+    },
     rules: {
         // Subject
         'subject-empty': [2, 'never'],
@@ -44,10 +44,9 @@ class GrowClusterTest(ClusterTester):
             node.remoter.send_files(cs_custom_config,
                                     '/tmp/cassandra-stress-custom-mixed-narrow-wide-row.yaml',
                                     verbose=True)
-        ip = self.db_cluster.get_node_private_ips()[0]
         return (r'cassandra-stress user '
                 r'profile=/tmp/cassandra-stress-custom-mixed-narrow-wide-row.yaml '
-                r'ops\(insert=1\) -node %s' % ip)
+                rf'ops\(insert=1\) -node {self.db_cluster.nodes[0].private_ip_address}')
 
     def get_stress_cmd(self, mode='write', duration=None):
         """
@@ -59,17 +58,16 @@ class GrowClusterTest(ClusterTester):
         :return: Cassandra stress string
         :rtype: basestring
         """
-        ip = self.db_cluster.get_node_private_ips()[0]
+        ip = self.db_cluster.nodes[0].private_ip_address
         population_size = self.params.get('cassandra_stress_population_size')
         if not duration:
             duration = self.params.get('test_duration')
         threads = self.params.get('cassandra_stress_threads')
 
-        return ("cassandra-stress %s cl=QUORUM duration=%sm "
-                "-schema 'replication(factor=3)' -port jmx=6868 -col 'size=FIXED(2) n=FIXED(1)' "
-                "-mode cql3 native -rate threads=%s "
-                "-pop seq=1..%s -node %s" %
-                (mode, duration, threads, population_size, ip))
+        return (f"cassandra-stress {mode} cl=QUORUM duration={duration}m "
+                f"-schema 'replication(factor=3)' -port jmx=6868 -col 'size=FIXED(2) n=FIXED(1)' "
+                f"-mode cql3 native -rate threads={threads} "
+                f"-pop seq=1..{population_size} -node {ip}")
 
     def add_nodes(self, add_node_cnt):
         self.metrics_srv.event_start('add_node')
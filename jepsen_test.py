@@ -12,16 +12,18 @@
 # Copyright (c) 2020 ScyllaDB
 
 import os
-
-import requests
+import time
+from shlex import quote
+from concurrent.futures import ThreadPoolExecutor
 
 from sdcm.remote import shell_script_cmd
 from sdcm.tester import ClusterTester, teardown_on_exception
 from sdcm.utils.decorators import log_run_info
 
 
-JEPSEN_WEB_SERVER_START_DELAY = 15  # seconds
+JEPSEN_RUN_POLL_INTERVAL = 30  # seconds
 DB_SSH_KEY = "db_node_ssh_key"
+JEPSEN_DEB_PACKAGES = "libjna-java gnuplot-nox graphviz git"
 
 
 class JepsenTest(ClusterTester):
@@ -33,56 +35,137 @@ class JepsenTest(ClusterTester):
     @log_run_info
     def setup_jepsen(self):
         remoter = self.jepsen_node.remoter
-        remoter.sudo("apt-get install -y libjna-java gnuplot graphviz git")
+
+        # Remoter keeps a separate connection per thread, so it's safe to upload the key in parallel with the bootstrap.
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="JepsenSendSSHKeyThread")
+        send_key = executor.submit(remoter.send_files,
+                                   os.path.expanduser(self.db_cluster.nodes[0].ssh_login_info["key_file"]),
+                                   DB_SSH_KEY)
+        executor.shutdown(wait=False)
+
+        # Lein bootstrap doesn't depend on the apt packages, so run it in background.  Git clone needs git
+        # to be installed, that's why it starts right after the apt step.  All steps are skipped if already done
+        # on this node (e.g., on a retry.)  Jepsen's dependencies are pre-fetched here to not spend test time on it.
         remoter.run(shell_script_cmd(f"""\
-            curl -O https://raw.githubusercontent.com/technomancy/leiningen/stable/bin/lein
-            chmod +x lein
-            ./lein
-            git clone {self.params.get('jepsen_scylla_repo')} jepsen-scylla
+            (
+                if ! dpkg -s {JEPSEN_DEB_PACKAGES} > /dev/null 2>&1; then
+                    if [ -z "$(find /var/lib/apt/lists -maxdepth 1 -name "*_Packages" -mmin -60)" ]; then
+                        sudo apt-get update -qq
+                    fi
+                    sudo DEBIAN_FRONTEND=noninteractive apt-get install -y --no-install-recommends {JEPSEN_DEB_PACKAGES}
+                fi
+            ) &
+            APT=$!
+            (
+                if [ ! -x lein ] || ! ls ~/.lein/self-installs/leiningen-*-standalone.jar > /dev/null 2>&1; then
+                    curl -O https://raw.githubusercontent.com/technomancy/leiningen/stable/bin/lein
+                    chmod +x lein
+                    ./lein
+                fi
+            ) &
+            LEIN=$!
+            wait $APT
+            if [ -d jepsen-scylla ]; then
+                git -C jepsen-scylla remote set-url origin {self._jepsen_scylla_repo}
+                git -C jepsen-scylla fetch --depth 1 origin
+                git -C jepsen-scylla reset --hard FETCH_HEAD
+            else
+                git clone --depth 1 --single-branch {self._jepsen_scylla_repo} jepsen-scylla
+            fi
+            wait $LEIN
+            cd jepsen-scylla
+            ~/lein deps
+        """, quote="'"))
+        remoter.run(shell_script_cmd(f"""\
+            touch ~/.ssh/known_hosts
+            ssh-keyscan -T 10 -t rsa {' '.join(self._db_nodes_ips)} | sort -u - ~/.ssh/known_hosts > ~/.ssh/known_hosts.new
+            chmod 600 ~/.ssh/known_hosts.new
+            mv -f ~/.ssh/known_hosts.new ~/.ssh/known_hosts
         """))
-        for db_node in self.db_cluster.nodes:
-            remoter.run(f"ssh-keyscan -t rsa {db_node.ip_address} >> ~/.ssh/known_hosts")
-        remoter.send_files(os.path.expanduser(self.db_cluster.nodes[0].ssh_login_info["key_file"]), DB_SSH_KEY)
+        send_key.result()
 
     def setUp(self):
+        self._jepsen_scylla_repo = self.params.get("jepsen_scylla_repo")
+        self._jepsen_test_cmd = self.params.get("jepsen_test_cmd")
+        self._jepsen_run_timeout = self.params.get("jepsen_run_timeout") or self.test_duration
+        self._scylla_repo = self.params.get("scylla_repo")
         super().setUp()
+        self._db_nodes_ips = [db_node.ip_address for db_node in self.db_cluster.nodes]
         self.setup_jepsen()
 
     def test_jepsen(self):
-        tests = self.params.get('jepsen_test_cmd')
-        nodes = " ".join(f"--node {node.ip_address}" for node in self.db_cluster.nodes)
+        tests = self._jepsen_test_cmd
+        nodes = " ".join(f"--node {ip_address}" for ip_address in self._db_nodes_ips)
         creds = f"--username {self.db_cluster.nodes[0].ssh_login_info['user']} --ssh-private-key ~/{DB_SSH_KEY}"
         jepsen_cmd = f"cd ~/jepsen-scylla && ~/lein run {tests} {nodes} {creds}"
 
         self.log.info("Run Jepsen test: `%s'", jepsen_cmd)
-        self.jepsen_node.remoter.run(jepsen_cmd)
+
+        # Jepsen run can take hours, so detach it from the SSH session and poll for its exit status instead of
+        # holding one command open for the whole run.
+        remoter = self.jepsen_node.remoter
+        jepsen_run_cmd = f"{jepsen_cmd} > ~/jepsen.log 2>&1; echo $? > ~/jepsen.exit"
+        remoter.run(f"rm -f ~/jepsen.log ~/jepsen.exit ~/jepsen.pid && "
+                    f"(setsid bash -c {quote(jepsen_run_cmd)} < /dev/null > /dev/null 2>&1 & echo $! > ~/jepsen.pid)")
+
+        deadline = time.time() + self._jepsen_run_timeout * 60
+        log_offset = 1
+        while True:
+            # Check the process before the exit status file: it's written right before the process exits.
+            is_running = remoter.run("kill -0 $(cat ~/jepsen.pid)", ignore_status=True, verbose=False).ok
+            exit_status = remoter.run("cat ~/jepsen.exit", ignore_status=True, verbose=False)
+            log_offset = self._print_jepsen_log(log_offset)
+            if exit_status.ok:
+                break
+            assert is_running, "Jepsen test process has died without exit status"
+            if time.time() > deadline:
+                remoter.run("pkill -9 -s $(cat ~/jepsen.pid)", ignore_status=True)
+                raise AssertionError(f"Jepsen test didn't finish in {self._jepsen_run_timeout} minutes")
+            time.sleep(JEPSEN_RUN_POLL_INTERVAL)
+
+        exit_status = int(exit_status.stdout.strip())
+        assert exit_status == 0, f"Jepsen test failed with exit status {exit_status}"
+
+    def _print_jepsen_log(self, offset: int) -> int:
+        """Log lines of ~/jepsen.log starting from line number `offset' and return the number of the next line."""
+
+        lines = self.jepsen_node.remoter.run(f"tail -n +{offset} ~/jepsen.log", ignore_status=True, verbose=False) \
+            .stdout.split("\n")[:-1]  # the last line can be incomplete yet
+        for line in lines:
+            self.log.info("Jepsen: %s", line)
+        return offset + len(lines)
 
     def save_jepsen_report(self):
-        url = f"http://{self.jepsen_node.external_address}:8080/"
+        remote_report = "/tmp/jepsen_report.tgz"
+        local_report = os.path.join(self.logdir, "jepsen_report.tgz")
 
-        self.log.info("Start web server to serve Jepsen results (will listen on %s)...", url)
-        self.jepsen_node.remoter.run(shell_script_cmd(f"""\
-            cd ~/jepsen-scylla
-            setsid ~/lein run serve > save_jepsen_report.log 2>&1 < /dev/null &
-            sleep {JEPSEN_WEB_SERVER_START_DELAY}
-        """), verbose=True)
+        # There are no results if the Jepsen run failed before any test started.
+        if not self.jepsen_node.remoter.run("test -d ~/jepsen-scylla/store/latest", ignore_status=True).ok:
+            self.log.warning("There are no Jepsen results of the latest run, the report is skipped")
+            return None
 
-        with open(os.path.join(self.logdir, "jepsen_report.html"), "wt") as jepsen_report:
-            jepsen_report.write(requests.get(url).text)
-        self.log.info("Report has been saved to %s", jepsen_report.name)
+        self.log.info("Pack Jepsen results of the latest run and download them to %s...", local_report)
+        self.jepsen_node.remoter.run(f"tar -czhf {remote_report} -C ~/jepsen-scylla/store latest", verbose=True)
+        self.jepsen_node.remoter.receive_files(src=remote_report, dst=local_report)
+        self.log.info("Report has been saved to %s", local_report)
 
-        return jepsen_report.name
+        return local_report
 
     def get_email_data(self):
         self.log.info("Prepare data for email")
         email_data = self._get_common_email_data()
-        grafana_dataset = self.monitors.get_grafana_screenshot_and_snapshot(self.start_time) if self.monitors else {}
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="JepsenEmailDataThread") as executor:
+            grafana_dataset = executor.submit(self.monitors.get_grafana_screenshot_and_snapshot, self.start_time) \
+                if self.monitors else None
+            jepsen_report = executor.submit(self.save_jepsen_report)
+            grafana_dataset = grafana_dataset.result() if grafana_dataset else {}
+            jepsen_report = jepsen_report.result()
         email_data.update({
             "grafana_screenshots": grafana_dataset.get("screenshots", []),
             "grafana_snapshots": grafana_dataset.get("snapshots", []),
-            "jepsen_report": self.save_jepsen_report(),
-            "jepsen_scylla_repo": self.params.get("jepsen_scylla_repo"),
-            "jepsen_test_cmd": self.params.get("jepsen_test_cmd"),
-            "scylla_repo": self.params.get("scylla_repo"),
+            "jepsen_report": jepsen_report,
+            "jepsen_scylla_repo": self._jepsen_scylla_repo,
+            "jepsen_test_cmd": self._jepsen_test_cmd,
+            "scylla_repo": self._scylla_repo,
         })
         return email_data
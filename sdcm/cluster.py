@@ -58,7 +58,7 @@ from sdcm import wait, mgmt
 from sdcm.utils import alternator
 from sdcm.utils.common import deprecation, get_data_dir_path, verify_scylla_repo_file, S3Storage, get_my_ip, \
     get_latest_gemini_version, normalize_ipv6_url, download_dir_from_cloud, generate_random_string, ScyllaCQLSession, \
-    SCYLLA_YAML_PATH, get_test_name
+    SCYLLA_YAML_PATH, get_test_name, ParallelObject
 from sdcm.utils.distro import Distro
 from sdcm.utils.docker_utils import ContainerManager, NotFound
 
@@ -2953,7 +2953,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         return results
 
     def get_backtraces(self):
-        for node in self.nodes:
+        def get_node_backtraces(node):
             try:
                 node.get_backtraces()
                 if node.n_coredumps > 0:
@@ -2961,6 +2961,10 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
             except Exception as ex:  # pylint: disable=broad-except
                 self.log.exception("Unable to get coredump status from node {node}: {ex}".format(node=node, ex=ex))
 
+        # Coredumps processing is independent per node and can take a while (e.g., upload), so run it in parallel.
+        if self.nodes:
+            ParallelObject(self.nodes, timeout=None, num_workers=len(self.nodes)).run(get_node_backtraces)
+
     def node_setup(self, node, verbose=False, timeout=3600):
         raise NotImplementedError("Derived class must implement 'node_setup' method!")
 
@@ -27,13 +27,14 @@ from typing import List, Dict, Optional
 from datetime import datetime
 from textwrap import dedent
 from functools import cached_property
+from collections import defaultdict
 from contextlib import ExitStack
 
 import yaml
 import boto3
 from mypy_boto3_ec2 import EC2Client
 from pkg_resources import parse_version
-from botocore.exceptions import WaiterError
+from botocore.exceptions import WaiterError, ClientError
 
 from sdcm import ec2_client, cluster
 from sdcm.remote import LocalCmdRunner, shell_script_cmd, NETWORK_EXCEPTIONS
@@ -54,6 +55,9 @@ INSTANCE_PROVISION_SPOT_DURATION = 'spot_duration'
 SPOT_CNT_LIMIT = 20
 SPOT_FLEET_LIMIT = 50
 SPOT_TERMINATION_CHECK_OVERHEAD = 15
+# Instances usually reach `running' state in less than a minute, so poll more often than the boto3 default (15s),
+# keeping the same overall timeout of 10 minutes.
+INSTANCE_RUNNING_WAITER_CONFIG = {'Delay': 5, 'MaxAttempts': 120}
 LOCAL_CMD_RUNNER = LocalCmdRunner()
 
 # pylint: disable=too-many-lines
@@ -74,7 +78,8 @@ class AWSCluster(cluster.BaseCluster):  # pylint: disable=too-many-instance-attr
                  ec2_instance_type='c5.xlarge', ec2_ami_username='root',
                  ec2_user_data='', ec2_block_device_mappings=None,
                  cluster_prefix='cluster',
-                 node_prefix='node', n_nodes=10, params=None, node_type=None, extra_network_interface=False):
+                 node_prefix='node', n_nodes=10, params=None, node_type=None, extra_network_interface=False,
+                 ec2_instance_type_fallbacks=None):
         # pylint: disable=too-many-locals
         region_names = params.get('region_name').split()
         if len(credentials) > 1 or len(region_names) > 1:
@@ -90,6 +95,7 @@ class AWSCluster(cluster.BaseCluster):  # pylint: disable=too-many-instance-attr
         self._credentials = credentials
         self._reuse_credentials = None
         self._ec2_instance_type = ec2_instance_type
+        self._ec2_instance_type_fallbacks = ec2_instance_type_fallbacks or []
         self._ec2_ami_username = ec2_ami_username
         if ec2_block_device_mappings is None:
             ec2_block_device_mappings = []
@@ -126,12 +132,22 @@ class AWSCluster(cluster.BaseCluster):  # pylint: disable=too-many-instance-attr
                       MaxCount=count,
                       KeyName=self._credentials[dc_idx].key_pair_name,
                       BlockDeviceMappings=self._ec2_block_device_mappings,
-                      NetworkInterfaces=interfaces,
-                      InstanceType=self._ec2_instance_type)
+                      NetworkInterfaces=interfaces)
         instance_profile = self.params.get('aws_instance_profile_name')
         if instance_profile:
             params['IamInstanceProfile'] = {'Name': instance_profile}
-        instances = self._ec2_services[dc_idx].create_instances(**params)
+
+        # Try instance types in order of priority and launch into the first one with available capacity.
+        instance_types = [self._ec2_instance_type, *self._ec2_instance_type_fallbacks]
+        for instance_type in instance_types:
+            try:
+                instances = self._ec2_services[dc_idx].create_instances(InstanceType=instance_type, **params)
+                break
+            except ClientError as exc:
+                if exc.response['Error']['Code'] != 'InsufficientInstanceCapacity' \
+                        or instance_type == instance_types[-1]:
+                    raise
+                self.log.warning("No capacity for %s instance type, try the next one: %s", instance_type, exc)
         self.log.debug("Created instances: %s." % instances)
         return instances
 
@@ -459,6 +475,32 @@ class AWSCluster(cluster.BaseCluster):  # pylint: disable=too-many-instance-attr
         node.init()
         return node
 
+    def destroy(self):
+        self.log.info('Destroy nodes')
+        for node in self.nodes:
+            node.stop_task_threads()
+        for node in self.nodes:
+            node.wait_till_tasks_threads_are_stopped()
+
+        # Terminate instances of all nodes using one EC2 API call per region instead of a call per node.
+        nodes_per_region = defaultdict(list)
+        for node in self.nodes:
+            nodes_per_region[node.dc_idx].append(node)
+        nodes_to_terminate = set(self.nodes)
+        try:
+            for dc_idx, nodes in nodes_per_region.items():
+                try:
+                    self._ec2_services[dc_idx].meta.client.terminate_instances(
+                        InstanceIds=[node.instance_id for node in nodes])
+                except ClientError as exc:
+                    # One missing or invalid instance fails the call for all of them, let nodes terminate one by one.
+                    self.log.warning("Failed to terminate instances of region #%s in one call: %s", dc_idx, exc)
+                else:
+                    nodes_to_terminate.difference_update(nodes)
+        finally:
+            for node in self.nodes:
+                node.destroy(terminate_instance=node in nodes_to_terminate)
+
 
 class AWSNode(cluster.BaseNode):
     """
@@ -487,7 +529,7 @@ class AWSNode(cluster.BaseNode):
 
     def init(self):
         LOGGER.debug("Waiting until instance {0._instance} starts running...".format(self))
-        self._instance_wait_safe(self._instance.wait_until_running)
+        self._instance_wait_safe(self._instance.wait_until_running, WaiterConfig=INSTANCE_RUNNING_WAITER_CONFIG)
 
         if not cluster.Setup.REUSE_CLUSTER:
             resources_to_tag = [self._instance.id, ]
@@ -595,7 +637,8 @@ class AWSNode(cluster.BaseNode):
             interface for interface in self._instance.network_interfaces if interface.attachment['DeviceIndex'] == 0][0]
         if primary_interface.association_attribute is None:
             # create and attach EIP
-            client: EC2Client = boto3.client('ec2', region_name=parent_cluster.region_names[dc_idx])
+            client: EC2Client = boto3.client('ec2', region_name=parent_cluster.region_names[dc_idx],
+                                             config=ec2_client.EC2_CLIENT_CONFIG)
             response = client.allocate_address(Domain='vpc')
 
             self.eip_allocation_id = response['AllocationId']
@@ -709,7 +752,7 @@ class AWSNode(cluster.BaseNode):
             self._instance.stop()
             self._instance_wait_safe(self._instance.wait_until_stopped)
             self._instance.start()
-            self._instance_wait_safe(self._instance.wait_until_running)
+            self._instance_wait_safe(self._instance.wait_until_running, WaiterConfig=INSTANCE_RUNNING_WAITER_CONFIG)
             self._wait_public_ip()
 
             self.log.debug("Got a new public IP: %s", self._instance.public_ip_address)
@@ -748,13 +791,24 @@ class AWSNode(cluster.BaseNode):
     def release_address(self):
         self._instance.wait_until_terminated()
 
-        client: EC2Client = boto3.client('ec2', region_name=self.parent_cluster.region_names[self.dc_idx])
+        client: EC2Client = boto3.client('ec2', region_name=self.parent_cluster.region_names[self.dc_idx],
+                                         config=ec2_client.EC2_CLIENT_CONFIG)
         client.release_address(AllocationId=self.eip_allocation_id)
 
-    def destroy(self):
+    @property
+    def instance_id(self):
+        return self._instance.id
+
+    def destroy(self, terminate_instance=True):
         self.stop_task_threads()
         self.wait_till_tasks_threads_are_stopped()
-        self._instance.terminate()
+        if terminate_instance:
+            try:
+                self._instance.terminate()
+            except ClientError as exc:
+                if exc.response['Error']['Code'] != 'InvalidInstanceID.NotFound':
+                    raise
+                self.log.warning("Instance %s is already gone: %s", self.instance_id, exc)
         if self.eip_allocation_id:
             self.release_address()
         super().destroy()
@@ -824,7 +878,8 @@ class ScyllaAWSCluster(cluster.BaseScyllaCluster, AWSCluster):
                  ec2_block_device_mappings=None,
                  user_prefix=None,
                  n_nodes=3,
-                 params=None):
+                 params=None,
+                 ec2_instance_type_fallbacks=None):
         # pylint: disable=too-many-locals
         # We have to pass the cluster name in advance in user_data
         cluster_uuid = cluster.Setup.test_id()
@@ -862,7 +917,8 @@ class ScyllaAWSCluster(cluster.BaseScyllaCluster, AWSCluster):
                                                n_nodes=n_nodes,
                                                params=params,
                                                node_type=node_type,
-                                               extra_network_interface=params.get('extra_network_interface'))
+                                               extra_network_interface=params.get('extra_network_interface'),
+                                               ec2_instance_type_fallbacks=ec2_instance_type_fallbacks)
         self.version = '2.1'
 
     def add_nodes(self, count, ec2_user_data='', dc_idx=0, rack=0, enable_auto_bootstrap=False):
@@ -1040,7 +1096,7 @@ class LoaderSetAWS(cluster.BaseLoaderSet, AWSCluster):
                  services, credentials, ec2_instance_type='c5.xlarge',
                  ec2_block_device_mappings=None,
                  ec2_ami_username='centos',
-                 user_prefix=None, n_nodes=10, params=None):
+                 user_prefix=None, n_nodes=10, params=None, ec2_instance_type_fallbacks=None):
         # pylint: disable=too-many-locals
         node_prefix = cluster.prepend_user_prefix(user_prefix, 'loader-node')
         node_type = 'loader'
@@ -1064,7 +1120,8 @@ class LoaderSetAWS(cluster.BaseLoaderSet, AWSCluster):
                             node_prefix=node_prefix,
                             n_nodes=n_nodes,
                             params=params,
-                            node_type=node_type)
+                            node_type=node_type,
+                            ec2_instance_type_fallbacks=ec2_instance_type_fallbacks)
 
 
 class MonitorSetAWS(cluster.BaseMonitorSet, AWSCluster):
@@ -1,24 +1,58 @@
 import re
+import shlex
 import datetime
 import time
 import os
 import subprocess
 import platform
 import logging
-import json
+import threading
 from textwrap import dedent
 from math import sqrt
+from functools import lru_cache
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 import requests
 
+from sdcm import sct_abs_path
 from sdcm.es import ES
 from sdcm.utils.common import get_job_name, normalize_ipv6_url
 from sdcm.utils.decorators import retrying
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 LOGGER = logging.getLogger(__name__)
 
+CS_COMMANDS = ('read', 'write', 'mixed', 'counter_write', 'user', )
+CS_COMMAND_PARAMS = ('cl', 'duration', 'n', 'profile', )
+CS_RATE_PARAMS = {'threads': 'rate threads', 'throttle': 'throttle threads', 'fixed': 'fixed threads', }
+CS_KEY_VALUE_SEPARATOR_REGEX = re.compile(r'\s*=\s*')
+SCYLLA_BENCH_PARAMS = ('partition-count', 'clustering-row-count', 'clustering-row-size', 'mode', 'workload',
+                       'concurrency', 'max-rate', 'connection-count', 'replication-factor', 'timeout',
+                       'client-compression', 'duration', )
+SCYLLA_BENCH_PARAMS_REGEXES = {key: re.compile(r'(-' + key + r'\s+([^-| ]+))') for key in SCYLLA_BENCH_PARAMS}
+YCSB_THREADS_REGEX = re.compile(r'-threads\s*(.*?)[\s$]')
+YCSB_KEY_VALUE_REGEX = re.compile(r"-p\s.*?(?P<key>.*?)=(?P<value>.*?)(\s|$)")
+# Matches scylla-{jmx,server,tools} and scylla-enterprise-{jmx,server,tools} packages.
+SCYLLA_PACKAGE_REGEX = re.compile(
+    r'(?P<package>scylla-(?:enterprise-)?(?:jmx|server|tools))-(?P<version>\S+)-(0.)?(?P<date>[0-9]{8,8}).(?P<commit_id>\w+).')
+MULTI_DC_N_DB_NODES_REGEX = re.compile(r'\s')
+
+# Start host and job details stay the same for the whole run.
+START_HOST = platform.node()
+JOB_NAME = get_job_name()
+BUILD_URL = os.environ.get('BUILD_URL', '')
+
 
 class CassandraStressCmdParseError(Exception):
     def __init__(self, cmd, ex):
@@ -36,8 +70,33 @@ class CassandraStressCmdParseError(Exception):
 
 
 def stddev(lst):
-    mean = float(sum(lst)) / len(lst)
-    return sqrt(sum((x - mean)**2 for x in lst) / len(lst))
+    """Population standard deviation calculated in one pass using Welford's algorithm."""
+    count, mean, sum_of_squares = 0, 0.0, 0.0
+    for value in lst:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        sum_of_squares += delta * (value - mean)
+    return sqrt(sum_of_squares / count)
+
+
+@lru_cache(maxsize=None)
+def get_sct_git_commit():
+    """Get SHA of the current SCT commit.
+
+    Read it from .git directory directly and fallback to `git rev-parse' if the ref is not a plain file
+    (e.g., packed refs or git worktree.)
+    """
+    git_dir = sct_abs_path(".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as git_head:
+            head = git_head.read().strip()
+        if not head.startswith("ref: "):  # detached HEAD
+            return head
+        with open(os.path.join(git_dir, head[5:])) as git_ref:
+            return git_ref.read().strip()
+    except OSError:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True).strip()
 
 
 def get_stress_cmd_params(cmd):
@@ -53,48 +112,47 @@ def get_stress_cmd_params(cmd):
     }
     try:
         cmd = cmd.strip().split('cassandra-stress')[1].strip()
-        if cmd.split(' ')[0] in ['read', 'write', 'mixed', 'counter_write', 'user']:
-            cmd_params['command'] = cmd.split(' ')[0]
-            if 'no-warmup' in cmd:
-                cmd_params['no-warmup'] = True
-
-            match = re.search(r'(cl\s?=\s?\w+)', cmd)
-            if match:
-                cmd_params['cl'] = match.group(0).split('=')[1].strip()
-
-            match = re.search(r'(duration\s?=\s?\w+)', cmd)
-            if match:
-                cmd_params['duration'] = match.group(0).split('=')[1].strip()
-
-            match = re.search(r'( n\s?=\s?\w+)', cmd)
-            if match:
-                cmd_params['n'] = match.group(0).split('=')[1].strip()
-            match = re.search(r'profile=(\S+)\s+', cmd)
-            if match:
-                cmd_params['profile'] = match.group(1).strip()
-                match = re.search(r'ops(\S+)\s+', cmd)
-                if match:
-                    cmd_params['ops'] = match.group(1).split('=')[0].strip('(')
-
-            for temp in cmd.split(' -')[1:]:
-                try:
-                    key, value = temp.split(" ", 1)
-                except ValueError as ex:
-                    LOGGER.warning("%s:%s", temp, ex)
+        try:
+            tokens = shlex.split(cmd)
+        except ValueError as exc:
+            LOGGER.warning("Failed to split cassandra-stress command `%s' with shell syntax: %s", cmd, exc)
+            tokens = cmd.split()
+        if tokens and tokens[0] in CS_COMMANDS:
+            cmd_params['command'] = tokens[0]
+
+            # Command section looks like `write no-warmup cl=QUORUM duration=10m' or
+            # `user profile=/tmp/profile.yaml ops(insert=1)' and followed by `-option value ...' sections.
+            # Spaces around `=' are allowed in the command section (e.g., `cl = QUORUM'.)
+            section_end = next((idx for idx, token in enumerate(tokens) if token.startswith('-')), len(tokens))
+            tokens = CS_KEY_VALUE_SEPARATOR_REGEX.sub("=", " ".join(tokens[1:section_end])).split() + \
+                tokens[section_end:]
+            options = {}
+            option = None
+            for token in tokens:
+                if token.startswith('-'):
+                    option = options[token[1:]] = []
+                elif option is not None:
+                    option.append(token)
+                elif token == 'no-warmup':
+                    cmd_params['no-warmup'] = True
+                elif token.startswith('ops'):
+                    cmd_params['ops'] = token[3:].split('=', 1)[0].strip("'(")
                 else:
-                    cmd_params[key] = value.strip().replace("'", "")
-            if 'rate' in cmd_params:
-                # split rate section on separate items
-                if 'threads' in cmd_params['rate']:
-                    cmd_params['rate threads'] = \
-                        re.search(r'(threads\s?=\s?(\w+))', cmd_params['rate']).group(2)
-                if 'throttle' in cmd_params['rate']:
-                    cmd_params['throttle threads'] =\
-                        re.search(r'(throttle\s?=\s?(\w+))', cmd_params['rate']).group(2)
-                if 'fixed' in cmd_params['rate']:
-                    cmd_params['fixed threads'] =\
-                        re.search(r'(fixed\s?=\s?(\w+))', cmd_params['rate']).group(2)
-                del cmd_params['rate']
+                    key, _, value = token.partition('=')
+                    if key in CS_COMMAND_PARAMS and value:
+                        cmd_params[key] = value
+
+            # split rate section on separate items
+            for rate_arg in " ".join(options.pop('rate', ())).split():
+                key, _, value = rate_arg.partition('=')
+                if key in CS_RATE_PARAMS:
+                    cmd_params[CS_RATE_PARAMS[key]] = value.split('/', 1)[0]
+
+            for key, values in options.items():
+                if values:
+                    cmd_params[key] = " ".join(values).strip().replace("'", "")
+                else:
+                    LOGGER.warning("No value for `-%s' option", key)
 
         return cmd_params
     except Exception as ex:
@@ -109,10 +167,8 @@ def get_stress_bench_cmd_params(cmd):
     """
     cmd = cmd.strip().split('scylla-bench')[1].strip()
     cmd_params = {}
-    for key in ['partition-count', 'clustering-row-count', 'clustering-row-size', 'mode',
-                'workload', 'concurrency', 'max-rate', 'connection-count', 'replication-factor',
-                'timeout', 'client-compression', 'duration']:
-        match = re.search(r'(-' + key + r'\s+([^-| ]+))', cmd)
+    for key, regex in SCYLLA_BENCH_PARAMS_REGEXES.items():
+        match = regex.search(cmd)
         if match:
             cmd_params[key] = match.group(2).strip()
     return cmd_params
@@ -129,12 +185,10 @@ def get_ycsb_cmd_params(cmd):
         "raw_cmd": cmd
     }
 
-    threads_regex = re.compile(r'-threads\s*(.*?)[\s$]')
-    key_value_regex = re.compile(r"-p\s.*?(?P<key>.*?)=(?P<value>.*?)(\s|$)")
-    for match in key_value_regex.finditer(cmd):
+    for match in YCSB_KEY_VALUE_REGEX.finditer(cmd):
         match_dict = match.groupdict()
         cmd_params[match_dict['key']] = match_dict['value']
-    match = threads_regex.search(cmd)
+    match = YCSB_THREADS_REGEX.search(cmd)
     if match:
         cmd_params['threads'] = match.group(1)
     return cmd_params
@@ -156,29 +210,59 @@ def get_cdcreader_cmd_params(cmd):
     return get_raw_cmd_params(cmd)
 
 
+STRESS_CMD_PARSERS = {
+    'cassandra-stress': get_stress_cmd_params,
+    'scylla-bench': get_stress_bench_cmd_params,
+    'ycsb': get_ycsb_cmd_params,
+    'gemini': get_gemini_cmd_params,
+    'ndbench': get_raw_cmd_params,
+    'cdcreader': get_cdcreader_cmd_params,
+}
+
+
 class PrometheusDBStats():
     def __init__(self, host, port=9090, alternator=None):
         self.host = host
         self.port = port
-        self.range_query_url = "http://{}:{}/api/v1/query_range?query=".format(normalize_ipv6_url(host), port)
-        self.config = self.get_configuration()
+        base_url = f"http://{normalize_ipv6_url(host)}:{port}/api/v1"
+        self.range_query_url = f"{base_url}/query_range?query="
+        self._config_url = f"{base_url}/status/config"
+        self._snapshot_url = f"{base_url}/admin/tsdb/snapshot"
         self.alternator = alternator
+        self._config = None
+        self._config_lock = threading.Lock()
+        # requests.Session isn't thread-safe, and stats are queried from several threads, so keep one per thread.
+        self._sessions = threading.local()
+
+    @property
+    def config(self):
+        """Prometheus configuration, it's requested on the first use only."""
+        with self._config_lock:
+            if self._config is None:
+                self._config = self.get_configuration()
+            return self._config
+
+    @property
+    def _session(self):
+        if not hasattr(self._sessions, "session"):
+            self._sessions.session = requests.Session()
+        return self._sessions.session
 
     @property
     def scylla_scrape_interval(self):
         return int(self.config["scrape_configs"]["scylla"]["scrape_interval"][:-1])
 
-    @staticmethod
     @retrying(n=5, sleep_time=7, allowed_exceptions=(requests.ConnectionError, requests.HTTPError))
-    def request(url, post=False):
+    def request(self, url, post=False):
         if post:
-            response = requests.post(url)
+            response = self._session.post(url)
         else:
-            response = requests.get(url)
+            response = self._session.get(url)
         response.raise_for_status()
 
-        result = json.loads(response.content)
-        LOGGER.debug("Response from Prometheus server: %s", str(result)[:200])
+        result = json_loads(response.content)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Response from Prometheus server: %s", str(result)[:200])
         if result["status"] == "success":
             return result
         else:
@@ -186,8 +270,8 @@ class PrometheusDBStats():
         return None
 
     def get_configuration(self):
-        result = self.request(url="http://{}:{}/api/v1/status/config".format(normalize_ipv6_url(self.host), self.port))
-        configs = yaml.safe_load(result["data"]["yaml"])
+        result = self.request(url=self._config_url)
+        configs = yaml.load(result["data"]["yaml"], Loader=YamlSafeLoader)
         LOGGER.debug("Parsed Prometheus configs: %s", configs)
         new_scrape_configs = {}
         for conf in configs["scrape_configs"]:
@@ -206,11 +290,9 @@ class PrometheusDBStats():
                   values: [[linux_timestamp1, value1], [linux_timestamp2, value2]...[linux_timestampN, valueN]]
                  }
         """
-        url = "http://{}:{}/api/v1/query_range?query=".format(normalize_ipv6_url(self.host), self.port)
         if not scrap_metrics_step:
             scrap_metrics_step = self.scylla_scrape_interval
-        _query = "{url}{query}&start={start}&end={end}&step={scrap_metrics_step}".format(
-            url=url, query=query, start=start, end=end, scrap_metrics_step=scrap_metrics_step)
+        _query = f"{self.range_query_url}{query}&start={start}&end={end}&step={scrap_metrics_step}"
         LOGGER.debug("Query to PrometheusDB: %s", _query)
         result = self.request(url=_query)
         if result:
@@ -317,8 +399,7 @@ class PrometheusDBStats():
                                 scrap_metrics_step=scrap_metrics_step)
 
     def create_snapshot(self):
-        url = "http://{}:{}/api/v1/admin/tsdb/snapshot".format(normalize_ipv6_url(self.host), self.port)
-        result = self.request(url, True)
+        result = self.request(self._snapshot_url, True)
         LOGGER.debug('Request result: {}'.format(result))
         return result
 
@@ -337,6 +418,9 @@ class Stats():
         self._es_doc_type = "test_stats"
         self.elasticsearch = self._create_es_connection()
         self._stats = {}
+        # Single worker keeps the order of updates.
+        self._es_updates_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ESUpdateThread")
+        self._es_last_update = None
         if not self._test_id:
             super(Stats, self).__init__(*args, **kwargs)
 
@@ -356,16 +440,38 @@ class Stats():
 
     def update(self, data):
         """
-        Update document
+        Update document in background, use wait_for_updates() to be sure that all updates are done
         :param data: data dictionary
         """
+        # Serializing the request body here snapshots the data, so later changes of the stats dicts
+        # don't leak into queued updates.
         try:
-            self.elasticsearch.update_doc(index=self._test_index, doc_type=self._es_doc_type,
-                                          doc_id=self._test_id, body=data)
+            body = self.elasticsearch.transport.serializer.dumps(dict(doc=data))
         except Exception as ex:  # pylint: disable=broad-except
             LOGGER.error('Failed to update test stats: test_id: %s, error: %s', self._test_id, ex)
+            return
+        self._es_last_update = self._es_updates_executor.submit(
+            self._update_doc, index=self._test_index, doc_id=self._test_id, body=body)
+
+    def _update_doc(self, index, doc_id, body):
+        try:
+            LOGGER.info('Update doc %s with info %s', doc_id, body)
+            self.elasticsearch.update(index=index, doc_type=self._es_doc_type, id=doc_id, body=body)
+        except Exception as ex:  # pylint: disable=broad-except
+            LOGGER.error('Failed to update test stats: test_id: %s, error: %s', doc_id, ex)
+
+    def wait_for_updates(self):
+        if self._es_last_update:
+            self._es_last_update.result()
+
+    def close(self):
+        """
+        Wait for all queued updates and stop the updates thread
+        """
+        self._es_updates_executor.shutdown(wait=True)
 
     def exists(self):
+        self.wait_for_updates()
         return self.elasticsearch.exists(index=self._test_index, doc_type=self._es_doc_type, id=self._test_id)
 
 
@@ -386,6 +492,9 @@ class TestStatsMixin(Stats):
     PROMETHEUS_STATS_UNITS = {'throughput': "op/s", 'latency_read_99': "us", 'latency_write_99': "us"}
     STRESS_STATS = ('op rate', 'latency mean', 'latency 99th percentile')
     STRESS_STATS_TOTAL = ('op rate', 'Total errors')
+    _test_details_update_pending = False
+    SETUP_DETAILS_EXCLUDE = frozenset(('send_email', 'email_recipients', 'es_url', 'es_password', 'reuse_cluster', ))
+    SETUP_DETAILS_EXCLUDE_GCE = frozenset(('instance_type_loader', 'instance_type_monitor', 'instance_type_db', ))
 
     @staticmethod
     def _create_test_id(doc_id_with_timestamp=False):
@@ -420,36 +529,33 @@ class TestStatsMixin(Stats):
                 version_cmd = "dpkg -l |grep scylla|awk '{print $2 \"-\" $3}'"
             versions_output = node.remoter.run(version_cmd).stdout.splitlines()
             for line in versions_output:
-                for package in ['scylla-jmx', 'scylla-server', 'scylla-tools', 'scylla-enterprise-jmx',
-                                'scylla-enterprise-server', 'scylla-enterprise-tools']:
-                    match = re.search(r'(%s-(\S+)-(0.)?([0-9]{8,8}).(\w+).)' % package, line)
-                    if match:
-                        versions[package.replace('-enterprise', '')] = {'version': match.group(2),
-                                                                        'date': match.group(4),
-                                                                        'commit_id': match.group(5)}
+                match = SCYLLA_PACKAGE_REGEX.search(line)
+                if match:
+                    versions[match.group('package').replace('-enterprise', '')] = {
+                        'version': match.group('version'),
+                        'date': match.group('date'),
+                        'commit_id': match.group('commit_id'),
+                    }
         except Exception as ex:  # pylint: disable=broad-except
             LOGGER.error('Failed getting scylla versions: %s', ex)
 
         return versions
 
     def get_setup_details(self):
-        exclude_details = ['send_email', 'email_recipients', 'es_url', 'es_password', 'reuse_cluster']
         setup_details = {}
         is_gce = self.params.get('cluster_backend') == 'gce'
 
         test_params = self.params.items()
 
         for key, value in test_params:
-            if key in exclude_details or (isinstance(key, str) and key.startswith('stress_cmd')):  # pylint: disable=no-else-continue
+            if key in self.SETUP_DETAILS_EXCLUDE or (isinstance(key, str) and key.startswith('stress_cmd')):  # pylint: disable=no-else-continue
                 continue
             else:
-                if is_gce and key in \
-                        ['instance_type_loader',  # pylint: disable=no-else-continue
-                         'instance_type_monitor',
-                         'instance_type_db']:
+                if is_gce and key in self.SETUP_DETAILS_EXCLUDE_GCE:  # pylint: disable=no-else-continue
                     # exclude these params from gce run
                     continue
-                elif key == 'n_db_nodes' and isinstance(value, str) and re.search(r'\s', value):  # multidc
+                elif key == 'n_db_nodes' and isinstance(value, str) \
+                        and MULTI_DC_N_DB_NODES_REGEX.search(value):  # multidc
                     setup_details['n_db_nodes'] = sum([int(i) for i in value.split()])
                 else:
                     setup_details[key] = value
@@ -469,10 +575,10 @@ class TestStatsMixin(Stats):
         from sdcm.cluster import Setup
 
         test_details = {}
-        test_details['sct_git_commit'] = subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True).strip()
-        test_details['job_name'] = get_job_name()
-        test_details['job_url'] = os.environ.get('BUILD_URL', '')
-        test_details['start_host'] = platform.node()
+        test_details['sct_git_commit'] = get_sct_git_commit()
+        test_details['job_name'] = JOB_NAME
+        test_details['job_url'] = BUILD_URL
+        test_details['start_host'] = START_HOST
         test_details['test_duration'] = self.params.get(key='test_duration')
         test_details['start_time'] = time.time()
         test_details['grafana_snapshots'] = []
@@ -507,23 +613,14 @@ class TestStatsMixin(Stats):
             self._stats['results'].update(specific_tested_stats)
             self.log.info("Creating specific tested stats of: {}".format(specific_tested_stats))
         self.create()
+        self._test_details_update_pending = False
 
     def update_stress_cmd_details(self, cmd, prefix='', stresser="cassandra-stress", aggregate=True):
         section = '{prefix}{stresser}'.format(prefix=prefix, stresser=stresser)
         if section not in self._stats['test_details']:
             self._stats['test_details'][section] = [] if aggregate else {}
-        if stresser == "cassandra-stress":
-            cmd_params = get_stress_cmd_params(cmd)
-        elif stresser == "scylla-bench":
-            cmd_params = get_stress_bench_cmd_params(cmd)
-        elif stresser == 'ycsb':
-            cmd_params = get_ycsb_cmd_params(cmd)
-        elif stresser in ['gemini', 'ndbench']:
-            cmd_params = get_raw_cmd_params(cmd)
-        elif stresser == 'gemini':
-            cmd_params = get_gemini_cmd_params(cmd)
-        elif stresser == 'cdcreader':
-            cmd_params = get_cdcreader_cmd_params(cmd)
+        if stresser in STRESS_CMD_PARSERS:
+            cmd_params = STRESS_CMD_PARSERS[stresser](cmd)
         else:
             cmd_params = None
             self.log.warning("Unknown stresser: %s" % stresser)
@@ -532,7 +629,8 @@ class TestStatsMixin(Stats):
                 self._stats['test_details'][section].append(cmd_params)
             else:
                 self._stats['test_details'][section].update(cmd_params)
-            self.update(dict(test_details=self._stats['test_details']))
+            # Don't hit ES for every stress command: test details are sent with next results or test details update.
+            self._test_details_update_pending = True
 
     def _calc_stats(self, ps_results):
         try:
@@ -543,9 +641,10 @@ class TestStatsMixin(Stats):
             ops_per_sec = [float(val) for _, val in ps_results if val.lower() != "nan"]  # float("nan") is not a number
             stat["max"] = max(ops_per_sec)
             # filter all values that are less than 1% of max
-            ops_filtered = [x for x in ops_per_sec if x >= stat["max"] * 0.01]
+            threshold = stat["max"] * 0.01
+            ops_filtered = [x for x in ops_per_sec if x >= threshold]
             stat["min"] = min(ops_filtered)
-            stat["avg"] = float(sum(ops_filtered)) / len(ops_filtered)
+            stat["avg"] = sum(ops_filtered) / len(ops_filtered)
             stat["stdev"] = stddev(ops_filtered)
             self.log.debug("Stats: %s", stat)
             return stat
@@ -561,11 +660,13 @@ class TestStatsMixin(Stats):
         offset = 120  # 2 minutes offset
         start = int(self._stats["test_details"]["start_time"] + offset)
         end = int(time.time() - offset)
-        prometheus_stats = {}
-        for stat in self.PROMETHEUS_STATS:
-            stat_calc_func = getattr(prometheus_db_stats, "get_" + stat)
-            prometheus_stats[stat] = self._calc_stats(ps_results=stat_calc_func(start_time=start, end_time=end,
-                                                                                scrap_metrics_step=scrap_metrics_step))
+        with ThreadPoolExecutor(max_workers=len(self.PROMETHEUS_STATS),
+                                thread_name_prefix="PrometheusStatsThread") as executor:
+            ps_results = {stat: executor.submit(getattr(prometheus_db_stats, "get_" + stat),
+                                                start_time=start, end_time=end, scrap_metrics_step=scrap_metrics_step)
+                          for stat in self.PROMETHEUS_STATS}
+            prometheus_stats = {stat: self._calc_stats(ps_results=future.result())
+                                for stat, future in ps_results.items()}
         self._stats['results'].update(prometheus_stats)
         return prometheus_stats
 
@@ -577,7 +678,11 @@ class TestStatsMixin(Stats):
         if calculate_stats:
             self.calculate_stats_average()
             self.calculate_stats_total()
-        self.update(dict(results=self._stats['results']))
+        update_data = dict(results=self._stats['results'])
+        if self._test_details_update_pending:
+            update_data["test_details"] = self._stats['test_details']
+            self._test_details_update_pending = False
+        self.update(update_data)
 
     def _convert_stat(self, stat, stress_result):
         if stat not in stress_result or stress_result[stat] == 'NaN':
@@ -590,33 +695,36 @@ class TestStatsMixin(Stats):
                              "Discarding stat." % (stress_result[stat], stat, details))
         return 0
 
-    def _calc_stat_total(self, stat):
-        total = 0
+    def _calc_stats_total(self, stats):
+        totals = dict.fromkeys(stats, 0)
+        remaining_stats = list(stats)
+        convert_stat = self._convert_stat
         for stress_result in self._stats['results']['stats']:
-            stat_val = self._convert_stat(stat=stat, stress_result=stress_result)
-            if not stat_val:
-                return 0  # discarding all stat results completely if one of the results is bad
-            total += stat_val
-        return total
+            for stat in tuple(remaining_stats):
+                stat_val = convert_stat(stat=stat, stress_result=stress_result)
+                if not stat_val:
+                    # discarding all stat results completely if one of the results is bad
+                    remaining_stats.remove(stat)
+                    totals[stat] = 0
+                else:
+                    totals[stat] += stat_val
+            if not remaining_stats:
+                break
+        return totals
 
     def calculate_stats_average(self):
         # calculate average stats
-        average_stats = {}
-        for stat in self.STRESS_STATS:
-            average_stats[stat] = ''  # default
-            total = self._calc_stat_total(stat=stat)
-            if total:
-                average_stats[stat] = round(total / len(self._stats['results']['stats']), 1)
-        self._stats['results']['stats_average'] = average_stats
+        results_count = len(self._stats['results']['stats'])
+        self._stats['results']['stats_average'] = {
+            stat: round(total / results_count, 1) if total else ''  # default
+            for stat, total in self._calc_stats_total(stats=self.STRESS_STATS).items()
+        }
 
     def calculate_stats_total(self):
-        total_stats = {}
-        for stat in self.STRESS_STATS_TOTAL:
-            total_stats[stat] = ''  # default
-            total = self._calc_stat_total(stat=stat)
-            if total:
-                total_stats[stat] = total
-        self._stats['results']['stats_total'] = total_stats
+        self._stats['results']['stats_total'] = {
+            stat: total if total else ''  # default
+            for stat, total in self._calc_stats_total(stats=self.STRESS_STATS_TOTAL).items()
+        }
 
     def update_test_details(self, errors=None, coredumps=None, scylla_conf=False, extra_stats=None, alternator=False,
                             scrap_metrics_step=None):
@@ -627,13 +735,11 @@ class TestStatsMixin(Stats):
             self.log.error("Stats was not initialized. Could be error during Setup")
             return
 
-        if extra_stats is None:
-            extra_stats = {}
-
-        update_data = {**extra_stats}
-        update_data["test_details"] = test_details = self._stats.setdefault("test_details", {})
-        update_data["setup_details"] = setup_details = self._stats.setdefault("setup_details", {})
-        update_data["status"] = self._stats["status"] = self.status
+        test_details = self._stats.setdefault("test_details", {})
+        setup_details = self._stats.setdefault("setup_details", {})
+        self._stats["status"] = self.status
+        self._test_details_update_pending = False
+        update_data = {"test_details": test_details, "setup_details": setup_details, "status": self.status}
 
         if errors:
             update_data["errors"] = errors
@@ -641,9 +747,12 @@ class TestStatsMixin(Stats):
         if coredumps:
             update_data["coredumps"] = coredumps
 
-        for key, value in extra_stats.items():
-            self.log.debug("extra stats -- k: %s v: %s", key, value)
-        self._stats["results"].update(extra_stats)
+        if extra_stats:
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("extra stats: %s", extra_stats)
+            for key, value in extra_stats.items():
+                update_data.setdefault(key, value)
+            self._stats["results"].update(extra_stats)
 
         test_details["time_completed"] = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M")
 
@@ -681,6 +790,7 @@ class TestStatsMixin(Stats):
 
     def get_doc_data(self, key):
         if self.create_stats and self._test_index and self.get_doc_id():
+            self.wait_for_updates()
             result = self.elasticsearch.get_doc(self._test_index, self.get_doc_id(), doc_type=self._es_doc_type)
 
             return result['_source'].get(key, None)
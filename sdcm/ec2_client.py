@@ -5,6 +5,7 @@ import base64
 
 import boto3
 from mypy_boto3_ec2 import EC2Client, EC2ServiceResource
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoRegionError
 
 from sdcm.utils.decorators import retrying
@@ -20,6 +21,10 @@ SPOT_CAPACITY_NOT_AVAILABLE_ERROR = 'capacity-not-available'
 MAX_SPOT_EXCEEDED_ERROR = 'MaxSpotInstanceCountExceeded'
 REQUEST_TIMEOUT = 300
 
+# Adaptive retries make the client adjust its requests rate under EC2 API throttling instead of plain fixed backoff,
+# and the large connection pool doesn't block clusters creation in parallel.
+EC2_CLIENT_CONFIG = Config(max_pool_connections=64, retries={'max_attempts': 10, 'mode': 'adaptive'})
+
 
 class GetSpotPriceHistoryError(Exception):
     pass
@@ -45,7 +50,7 @@ class EC2ClientWarpper():
 
     def __init__(self, timeout=REQUEST_TIMEOUT, region_name=None, spot_max_price_percentage=None):
         self._client = self._get_ec2_client(region_name)
-        self._resource: EC2ServiceResource = boto3.resource('ec2', region_name=region_name)
+        self._resource: EC2ServiceResource = boto3.resource('ec2', region_name=region_name, config=EC2_CLIENT_CONFIG)
         self.region_name = region_name
         self._timeout = timeout  # request timeout in seconds
         self._price_index = 1.5
@@ -54,7 +59,7 @@ class EC2ClientWarpper():
 
     def _get_ec2_client(self, region_name=None) -> EC2Client:
         try:
-            return boto3.client(service_name='ec2', region_name=region_name)
+            return boto3.client(service_name='ec2', region_name=region_name, config=EC2_CLIENT_CONFIG)
         except NoRegionError:
             if not region_name:
                 raise CreateEC2ClientNoRegionError()
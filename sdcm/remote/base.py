@@ -17,6 +17,7 @@ import shlex
 import logging
 import re
 import os
+import threading
 import subprocess
 from textwrap import dedent
 
@@ -25,6 +26,10 @@ from invoke.runners import Result
 from fabric import Connection
 
 
+LOG_FILE_BUFFER_SIZE = 1024 * 1024
+LOG_FILE_FLUSH_INTERVAL = 1  # seconds
+
+
 class OutputCheckError(Exception):
     """
     Remote command output check failed.
@@ -89,6 +94,12 @@ class CommandRunner(metaclass=ABCMeta):
             watchers.append(LogWriteWatcher(log_file))
         return watchers
 
+    @staticmethod
+    def _close_watchers(watchers: List[StreamWatcher]) -> None:
+        for watcher in watchers:
+            if isinstance(watcher, LogWriteWatcher):
+                watcher.close()
+
     # pylint: disable=too-many-arguments
     @abstractmethod
     def run(self,
@@ -226,24 +237,58 @@ class OutputWatcher(StreamWatcher):  # pylint: disable=too-few-public-methods
         self.log.debug(line.rstrip('\n'))
 
 
-class LogWriteWatcher(StreamWatcher):  # pylint: disable=too-few-public-methods
-    def __init__(self, log_file: str):
+class LogWriteWatcher(StreamWatcher):
+    """Append command output to a file.
+
+    The file is kept open for the lifetime of the command and written through a large buffer: long running commands
+    (e.g., stress tools) print a lot of short progress lines and reopening the file for each of them is expensive.
+    A background thread flushes the buffer every `flush_interval' seconds, so followers of the file (stress
+    watchdogs, events publishers) see the output with at most this delay, even when the command goes quiet.
+    Call close() when the command is done.
+    """
+
+    def __init__(self, log_file: str, flush_interval: float = LOG_FILE_FLUSH_INTERVAL):
         super().__init__()
         self.len = 0
         self.log_file = log_file
+        self.flush_interval = flush_interval
+        self._file = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = None
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(timeout=self.flush_interval):
+            with self._lock:
+                if self._file is not None:
+                    self._file.flush()
+
+    def _write(self, data: str) -> None:
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.log_file, "a+", buffering=LOG_FILE_BUFFER_SIZE)
+                self._flusher = threading.Thread(target=self._flush_periodically, daemon=True,
+                                                 name=f"LogWriteWatcherFlusher-{os.path.basename(self.log_file)}")
+                self._flusher.start()
+            self._file.write(data)
 
     def submit(self, stream: str) -> list:
-        stream_buffer = stream[self.len:]
-
-        with open(self.log_file, "a+") as log_file:
-            log_file.write(stream_buffer)
-
+        self._write(stream[self.len:])
         self.len = len(stream)
         return []
 
     def submit_line(self, line: str):
-        with open(self.log_file, "a+") as log_file:
-            log_file.write(line)
+        self._write(line)
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
 
 
 class FailuresWatcher(Responder):
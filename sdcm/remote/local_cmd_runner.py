@@ -80,7 +80,10 @@ class LocalCmdRunner(CommandRunner):  # pylint: disable=too-few-public-methods
                     self._print_command_results(details.result, verbose, ignore_status)
                 raise
 
-        result = _run()
+        try:
+            result = _run()
+        finally:
+            self._close_watchers(watchers)
         self._print_command_results(result, verbose, ignore_status)
         return result
 
@@ -601,7 +601,10 @@ class RemoteCmdRunnerBase(CommandRunner):  # pylint: disable=too-many-instance-a
                 if self._run_on_exception(exc, verbose, ignore_status):
                     raise
 
-        result = _run()
+        try:
+            result = _run()
+        finally:
+            self._close_watchers(watchers)
         self._print_command_results(result, verbose, ignore_status)
         if change_context and result.ok:
             # Will trigger reconnect on next run for any connection that belongs to the remoter
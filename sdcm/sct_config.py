@@ -479,12 +479,18 @@ class SCTConfiguration(dict):
         dict(name="instance_type_loader", env="SCT_INSTANCE_TYPE_LOADER", type=str,
              help="AWS image type of the loader node"),
 
+        dict(name="instance_type_loader_fallbacks", env="SCT_INSTANCE_TYPE_LOADER_FALLBACKS", type=str_or_list,
+             help="AWS image types of the loader node to try in order if there is no capacity for `instance_type_loader'"),
+
         dict(name="instance_type_monitor", env="SCT_INSTANCE_TYPE_MONITOR", type=str,
              help="AWS image type of the monitor node"),
 
         dict(name="instance_type_db", env="SCT_INSTANCE_TYPE_DB", type=str,
              help="AWS image type of the db node"),
 
+        dict(name="instance_type_db_fallbacks", env="SCT_INSTANCE_TYPE_DB_FALLBACKS", type=str_or_list,
+             help="AWS image types of the db node to try in order if there is no capacity for `instance_type_db'"),
+
         dict(name="instance_type_db_oracle", env="SCT_INSTANCE_TYPE_DB_ORACLE", type=str,
              help="AWS image type of the oracle node"),
 
@@ -1073,6 +1079,8 @@ class SCTConfiguration(dict):
              help="Link to the git repository with Jepsen Scylla tests"),
         dict(name="jepsen_test_cmd", env="SCT_JEPSEN_TEST_CMD", type=str,
              help="Jepsen test command (e.g., 'test-all')"),
+        dict(name="jepsen_run_timeout", env="SCT_JEPSEN_RUN_TIMEOUT", type=int,
+             help="Time (in minutes) to wait for the Jepsen test command to finish, defaults to test_duration"),
 
         dict(name="max_events_severities", env="SCT_MAX_EVENTS_SEVERITIES", type=str_or_list,
              help="Limit severity level for event types"),
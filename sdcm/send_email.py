@@ -517,6 +517,8 @@ class JepsenEmailReporter(BaseEmailReporter):
 
     @staticmethod
     def build_report_attachments(attachments_data, template_str=None):  # pylint: disable=unused-argument
+        if not attachments_data["jepsen_report"]:
+            return ()
         return (attachments_data["jepsen_report"], )
 
 
@@ -29,6 +29,13 @@ from sdcm.sct_events.loaders import CassandraStressEvent, CS_ERROR_EVENTS_PATTER
 
 LOGGER = logging.getLogger(__name__)
 
+CS_RESULTS_HEADER_REGEX = re.compile(r'^Results:')
+CS_END_REGEX = re.compile(r'^END$')
+# cassandra-stress without explicit threads count runs the workload several times with growing thread counts.
+CS_RATE_THREADS_REGEX = re.compile(r'-rate\s+[^-]*threads=\d+')
+CS_EXIT_GRACE_PERIOD = 120  # seconds
+CS_IO_ERROR_LINE_REGEX = re.compile(r'^.*java\.io\.IOException.*$', re.MULTILINE)
+
 
 def format_stress_cmd_error(exc: Exception) -> str:
     """Format nicely the exception from a stress command failure."""
@@ -60,6 +67,50 @@ class CassandraStressEventsPublisher(FileFollowerThread):
                         event.add_info(node=self.node, line=line, line_number=line_number).publish()
 
 
+class CassandraStressExitWatchdog(FileFollowerThread):  # pylint: disable=too-many-instance-attributes
+    """Kill cassandra-stress process which hangs on exit after it printed the results summary.
+
+    If the command has no fixed number of threads (`-rate threads=N'), cassandra-stress tunes the number of threads
+    and prints results for each of them, so only the `END' line after the last summary means the run is done.
+    """
+
+    def __init__(self, node: Any, cs_log_filename: str, run_marker: str,  # pylint: disable=too-many-arguments
+                 stress_cmd: str = "", grace_period: float = CS_EXIT_GRACE_PERIOD):
+        super().__init__()
+
+        self.node = node
+        self.cs_log_filename = cs_log_filename
+        self.run_marker = run_marker
+        self.grace_period = grace_period
+        self.summary_regex = CS_RESULTS_HEADER_REGEX if CS_RATE_THREADS_REGEX.search(stress_cmd) else CS_END_REGEX
+        self.killed = False
+
+    def run(self) -> None:
+        while not os.path.isfile(self.cs_log_filename):
+            if self.stopped():
+                return
+            time.sleep(0.5)
+
+        for line in self.follow_file(self.cs_log_filename):
+            if self.stopped():
+                return
+            if self.summary_regex.match(line):
+                break
+        else:
+            return
+
+        # The watchdog is stopped when the remote command returns, i.e., timeout of the wait means a hang on exit.
+        if not self._stop_event.wait(timeout=self.grace_period):
+            LOGGER.warning("%s: cassandra-stress didn't exit in %s seconds after printing results, kill it",
+                           self.node, self.grace_period)
+            self.killed = True
+            # Only the shell wrapper has the marker in its command line, and the java process hasn't, so kill the
+            # whole SSH session of the run.  The bracket keeps pgrep from matching the command line of this command.
+            run_marker_pattern = f"STRESS_RUN_MARKER=[{self.run_marker[0]}]{self.run_marker[1:]}"
+            self.node.remoter.run(cmd=f"pkill -9 -s $(ps -o sid= -p $(pgrep -o -f '{run_marker_pattern}'))",
+                                  ignore_status=True)
+
+
 class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
     def __init__(self, loader_set, stress_cmd, timeout, stress_num=1, keyspace_num=1, keyspace_name='',  # pylint: disable=too-many-arguments
                  profile=None, node_list=None, round_robin=False, client_encrypt=False, stop_test_on_failure=True):
@@ -169,11 +220,16 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         # we parse it to know the loader & cpu info in _parse_cs_summary().
         tag = f'TAG: loader_idx:{loader_idx}-cpu_idx:{cpu_idx}-keyspace_idx:{keyspace_idx}'
 
+        # Marks this particular run to be able to kill it if it hangs on exit.
+        run_marker = generate_random_string(20)
+        markers = f'STRESS_TEST_MARKER={self.shell_marker}; STRESS_RUN_MARKER={run_marker};'
         if self.stress_num > 1:
-            node_cmd = f'STRESS_TEST_MARKER={self.shell_marker}; taskset -c {cpu_idx} {stress_cmd}'
+            node_cmd = f'{markers} taskset -c {cpu_idx} {stress_cmd}'
         else:
-            node_cmd = f'STRESS_TEST_MARKER={self.shell_marker}; {stress_cmd}'
+            node_cmd = f'{markers} {stress_cmd}'
         node_cmd = f'echo {tag}; {node_cmd}'
+        exit_watchdog = CassandraStressExitWatchdog(node=node, cs_log_filename=log_file_name, run_marker=run_marker,
+                                                    stress_cmd=stress_cmd)
 
         result = None
 
@@ -183,15 +239,21 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
                                      stress_operation=stress_cmd_opt,
                                      stress_log_filename=log_file_name,
                                      loader_idx=loader_idx, cpu_idx=cpu_idx), \
-                CassandraStressEventsPublisher(node=node, cs_log_filename=log_file_name):
+                CassandraStressEventsPublisher(node=node, cs_log_filename=log_file_name), \
+                exit_watchdog:
             try:
                 result = node.remoter.run(cmd=node_cmd, timeout=self.timeout, log_file=log_file_name)
             except Exception as exc:
-                event_type = CassandraStressEvent.failure if self.stop_test_on_failure else CassandraStressEvent.error
-                event_type(node=node,
-                           stress_cmd=stress_cmd,
-                           log_file_name=log_file_name,
-                           errors=[format_stress_cmd_error(exc), ]).publish()
+                if exit_watchdog.killed and getattr(exc, "result", None) is not None:
+                    # Results have been printed completely, the process was killed by the watchdog on a hang on exit.
+                    result = exc.result
+                else:
+                    event_type = \
+                        CassandraStressEvent.failure if self.stop_test_on_failure else CassandraStressEvent.error
+                    event_type(node=node,
+                               stress_cmd=stress_cmd,
+                               log_file_name=log_file_name,
+                               errors=[format_stress_cmd_error(exc), ]).publish()
         CassandraStressEvent.finish(node=node, stress_cmd=stress_cmd, log_file_name=log_file_name).publish()
 
         return node, result
@@ -226,11 +288,18 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
             loaders = [self.loader_set.get_loader()]
         else:
             loaders = self.loader_set.nodes
-        for loader in loaders:
+        if not loaders:
+            return
+
+        def kill_on_loader(loader):
             loader.remoter.run(cmd=f"pkill -9 -f {self.shell_marker}",
                                timeout=self.timeout,
                                ignore_status=True)
 
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            for _ in executor.map(kill_on_loader, loaders):
+                pass
+
     def get_results(self):
         ret = []
         results = []
@@ -268,13 +337,10 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
                 # Silently skip if stress command threw error, since it was already reported in _run_stress
                 continue
             output = result.stdout + result.stderr
-            lines = output.splitlines()
-            node_cs_res = BaseLoaderSet._parse_cs_summary(lines)  # pylint: disable=protected-access
+            node_cs_res = BaseLoaderSet._parse_cs_summary(output.splitlines())  # pylint: disable=protected-access
             if node_cs_res:
                 cs_summary.append(node_cs_res)
-            for line in lines:
-                if 'java.io.IOException' in line:
-                    errors += ['%s: %s' % (node, line.strip())]
+            errors.extend(f"{node}: {line.strip()}" for line in CS_IO_ERROR_LINE_REGEX.findall(output))
 
         return cs_summary, errors
 
@@ -20,13 +20,14 @@ import random
 import unittest
 import warnings
 from uuid import uuid4
-from functools import wraps, cached_property
+from functools import wraps, cached_property, lru_cache
 import threading
 import multiprocessing
 import inspect
 import signal
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait as wait_futures
 
 import boto3.session
 from invoke.exceptions import UnexpectedExit, Failure
@@ -46,6 +47,7 @@ from sdcm.cluster_aws import ScyllaAWSCluster
 from sdcm.cluster_aws import LoaderSetAWS
 from sdcm.cluster_aws import MonitorSetAWS
 from sdcm.cluster_k8s import minikube, gke
+from sdcm.ec2_client import EC2_CLIENT_CONFIG
 from sdcm.scylla_bench_thread import ScyllaBenchThread
 from sdcm.utils.common import format_timestamp, wait_ami_available, tag_ami, update_certificates, \
     download_dir_from_cloud, get_post_behavior_actions, get_testrun_status, download_encrypt_keys, PageFetcher, \
@@ -64,7 +66,7 @@ from sdcm.sct_events.system import InfoEvent, TestFrameworkEvent, TestResultEven
 from sdcm.sct_events.database import FullScanEvent
 from sdcm.sct_events.file_logger import get_events_grouped_by_category, get_logger_event_summary
 from sdcm.sct_events.events_analyzer import stop_events_analyzer
-from sdcm.stress_thread import CassandraStressThread
+from sdcm.stress_thread import CassandraStressThread, CS_RATE_THREADS_REGEX
 from sdcm.gemini_thread import GeminiStressThread
 from sdcm.utils.prepare_region import AwsRegion
 from sdcm.ycsb_thread import YcsbStressThread
@@ -106,6 +108,29 @@ warnings.filterwarnings(action="ignore", message="unclosed",
                         category=ResourceWarning)
 TEST_LOG = logging.getLogger(__name__)
 
+# Time to let loaders init finish if DB nodes init failed, before tearDown starts with the same loader nodes.
+LOADERS_INIT_STOP_TIMEOUT = 300  # seconds
+
+# DB clusters to create for a `db_type' in form of {ClusterTester attribute: type of cluster}
+DB_CLUSTERS_BY_DB_TYPE = {
+    'scylla': {'db_cluster': 'scylla'},
+    'cassandra': {'db_cluster': 'cassandra'},
+    'mixed': {'db_cluster': 'scylla', 'cs_db_cluster': 'cassandra'},
+    'mixed_scylla': {'db_cluster': 'scylla', 'cs_db_cluster': 'mixed_scylla'},
+    'cloud_scylla': {'db_cluster': 'cloud_scylla'},
+}
+
+
+@lru_cache(maxsize=None)
+def get_boto3_session(region_name):
+    # Session caches loaded service models, so reuse it for all resources of a region.
+    return boto3.session.Session(region_name=region_name)
+
+
+def get_ec2_services(regions):
+    # boto3 sessions aren't thread-safe, so don't call it concurrently.
+    return [get_boto3_session(region).resource('ec2', config=EC2_CLIENT_CONFIG) for region in regions]
+
 
 def teardown_on_exception(method):
     """
@@ -447,16 +472,33 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         self.init_resources()
 
         if self.db_cluster and self.db_cluster.nodes:
-            if Setup.USE_LEGACY_CLUSTER_INIT:
-                self.legacy_init_nodes(db_cluster=self.db_cluster)
-            else:
-                self.init_nodes(db_cluster=self.db_cluster)
-            if self.params.get('use_ldap_authorization'):
-                self.db_cluster.nodes[0].create_ldap_users_on_scylla()
-            self.set_system_auth_rf()
-
-            db_node_address = self.db_cluster.nodes[0].ip_address
-            self.loaders.wait_for_init(db_node_address=db_node_address)
+            # Loaders setup doesn't need a running DB cluster, so run it in parallel with the DB nodes init.
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LoadersInitThread")
+            loaders_init = executor.submit(self.loaders.wait_for_init,
+                                           db_node_address=self.db_cluster.nodes[0].ip_address)
+            try:
+                if Setup.USE_LEGACY_CLUSTER_INIT:
+                    self.legacy_init_nodes(db_cluster=self.db_cluster)
+                else:
+                    self.init_nodes(db_cluster=self.db_cluster)
+                if self.params.get('use_ldap_authorization'):
+                    self.db_cluster.nodes[0].create_ldap_users_on_scylla()
+                self.set_system_auth_rf()
+            except Exception:
+                # tearDown collects logs from the loader nodes and destroys them, so don't leave loaders init
+                # running on them, but don't let it hide the DB nodes init error either.
+                if not loaders_init.cancel():
+                    try:
+                        loaders_init.result(timeout=LOADERS_INIT_STOP_TIMEOUT)
+                    except FuturesTimeoutError:
+                        self.log.warning("Loaders init didn't finish in %s seconds after DB nodes init failure",
+                                         LOADERS_INIT_STOP_TIMEOUT)
+                    except Exception as exc:  # pylint: disable=broad-except
+                        self.log.warning("Loaders init failed too: %s", exc)
+                raise
+            finally:
+                executor.shutdown(wait=False)
+            loaders_init.result()
 
         # cs_db_cluster is created in case MIXED_CLUSTER. For example, gemini test
         if self.cs_db_cluster:
@@ -665,6 +707,10 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
     def get_cluster_aws(self, loader_info, db_info, monitor_info):
         # pylint: disable=too-many-locals,too-many-statements,too-many-branches
         regions = self.params.get('region_name').split()
+        ami_id_loader = self.params.get('ami_id_loader').split()
+        ami_id_db_scylla = (self.params.get('ami_id_db_scylla') or '').split()
+        ami_id_monitor = (self.params.get('ami_id_monitor') or '').split()
+        user_prefix = self.params.get('user_prefix')
 
         if loader_info['n_nodes'] is None:
             n_loader_nodes = self.params.get('n_loaders')
@@ -681,7 +727,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         if loader_info['device_mappings'] is None:
             if loader_info['disk_size']:
                 loader_info['device_mappings'] = [{
-                    "DeviceName": ec2_ami_get_root_device_name(image_id=self.params.get('ami_id_loader').split()[0],
+                    "DeviceName": ec2_ami_get_root_device_name(image_id=ami_id_loader[0],
                                                                region=regions[0]),
                     "Ebs": {
                         "VolumeSize": loader_info['disk_size'],
@@ -703,10 +749,10 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
             db_info['type'] = self.params.get('instance_type_db')
         if db_info['disk_size'] is None:
             db_info['disk_size'] = self.params.get('aws_root_disk_size_db')
-        if db_info['device_mappings'] is None and self.params.get('ami_id_db_scylla'):
+        if db_info['device_mappings'] is None and ami_id_db_scylla:
             if db_info['disk_size']:
                 db_info['device_mappings'] = [{
-                    "DeviceName": ec2_ami_get_root_device_name(image_id=self.params.get('ami_id_db_scylla').split()[0],
+                    "DeviceName": ec2_ami_get_root_device_name(image_id=ami_id_db_scylla[0],
                                                                region=regions[0]),
                     "Ebs": {
                         "VolumeSize": db_info['disk_size'],
@@ -725,7 +771,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         if monitor_info['device_mappings'] is None:
             if monitor_info['disk_size']:
                 monitor_info['device_mappings'] = [{
-                    "DeviceName": ec2_ami_get_root_device_name(image_id=self.params.get('ami_id_monitor').split()[0],
+                    "DeviceName": ec2_ami_get_root_device_name(image_id=ami_id_monitor[0],
                                                                region=regions[0]),
                     "Ebs": {
                         "VolumeSize": monitor_info['disk_size'],
@@ -734,24 +780,17 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                 }]
             else:
                 monitor_info['device_mappings'] = []
-        user_prefix = self.params.get('user_prefix')
 
         user_credentials = self.params.get('user_credentials_path')
-        services = []
-        regions = self.params.get('region_name').split()
-        for region in regions:
-            session = boto3.session.Session(region_name=region)
-            service = session.resource('ec2')
-            services.append(service)
+        services = get_ec2_services(regions)
+        for _ in regions:
             self.credentials.append(UserRemoteCredentials(key_file=user_credentials))
 
-        ami_ids = self.params.get('ami_id_db_scylla').split()
-        for idx, ami_id in enumerate(ami_ids):
+        for idx, ami_id in enumerate(ami_id_db_scylla):
             wait_ami_available(services[idx].meta.client, ami_id)
         ec2_security_group_ids = []
         ec2_subnet_ids = []
-        cluster_backend = self.params.get('cluster_backend')
-        if "aws" in cluster_backend:
+        if "aws" in self.params.get('cluster_backend'):
             availability_zone = self.params.get("availability_zone")
             for region in regions:
                 aws_region = AwsRegion(region_name=region)
@@ -768,23 +807,26 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
 
         common_params = dict(ec2_security_group_ids=ec2_security_group_ids,
                              ec2_subnet_id=ec2_subnet_ids,
-                             services=services,
                              credentials=self.credentials,
                              user_prefix=user_prefix,
                              params=self.params
                              )
 
-        def create_cluster(db_type='scylla'):
+        ami_db_scylla_user = self.params.get('ami_db_scylla_user')
+
+        def create_cluster(db_type='scylla', cluster_services=None):
             cl_params = dict(
                 ec2_instance_type=db_info['type'],
                 ec2_block_device_mappings=db_info['device_mappings'],
-                n_nodes=db_info['n_nodes']
+                n_nodes=db_info['n_nodes'],
+                services=cluster_services,
             )
             cl_params.update(common_params)
             if db_type == 'scylla':
                 return ScyllaAWSCluster(
-                    ec2_ami_id=self.params.get('ami_id_db_scylla').split(),
-                    ec2_ami_username=self.params.get('ami_db_scylla_user'),
+                    ec2_ami_id=ami_id_db_scylla,
+                    ec2_ami_username=ami_db_scylla_user,
+                    ec2_instance_type_fallbacks=self.params.get('instance_type_db_fallbacks'),
                     **cl_params)
             elif db_type == 'cassandra':
                 return CassandraAWSCluster(
@@ -799,7 +841,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                                       n_nodes=[n_test_oracle_db_nodes]))
                 return ScyllaAWSCluster(
                     ec2_ami_id=self.params.get('ami_id_db_oracle').split(),
-                    ec2_ami_username=self.params.get('ami_db_scylla_user'),
+                    ec2_ami_username=ami_db_scylla_user,
                     **cl_params)
             elif db_type == 'cloud_scylla':
                 cloud_credentials = self.params.get('cloud_credentials_path')
@@ -807,7 +849,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                 credentials = [UserRemoteCredentials(key_file=cloud_credentials)]
                 params = dict(
                     n_nodes=[0],
-                    user_prefix=self.params.get('user_prefix'),
+                    user_prefix=user_prefix,
                     credentials=credentials,
                     params=self.params,
                 )
@@ -816,32 +858,34 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                 return cluster_cloud.ScyllaCloudCluster(**params)
             return None
 
+        # Provisioning is bound on AWS API round trips and instances start, so DB cluster(s) and loaders
+        # are created in parallel.  boto3 resources aren't thread-safe, so each cluster gets its own ones.
+        clusters = {}
         db_type = self.params.get('db_type')
-        if db_type in ('scylla', 'cassandra'):
-            self.db_cluster = create_cluster(db_type)
-        elif db_type == 'mixed':
-            self.db_cluster = create_cluster('scylla')
-            self.cs_db_cluster = create_cluster('cassandra')
-        elif db_type == 'mixed_scylla':
-            self.db_cluster = create_cluster('scylla')
-            self.cs_db_cluster = create_cluster('mixed_scylla')
-        elif db_type == 'cloud_scylla':
-            self.db_cluster = create_cluster('cloud_scylla')
-        else:
-            self.log.error('Incorrect parameter db_type: %s',
-                           self.params.get('db_type'))
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="CreateClusterThread") as executor:
+            if db_type in DB_CLUSTERS_BY_DB_TYPE:
+                for attr, cluster_type in DB_CLUSTERS_BY_DB_TYPE[db_type].items():
+                    clusters[attr] = executor.submit(create_cluster, cluster_type, get_ec2_services(regions))
+            else:
+                self.log.error('Incorrect parameter db_type: %s', db_type)
+
+            clusters['loaders'] = executor.submit(
+                LoaderSetAWS,
+                ec2_ami_id=ami_id_loader,
+                ec2_ami_username=self.params.get('ami_loader_user'),
+                ec2_instance_type=loader_info['type'],
+                ec2_instance_type_fallbacks=self.params.get('instance_type_loader_fallbacks'),
+                ec2_block_device_mappings=loader_info['device_mappings'],
+                n_nodes=loader_info['n_nodes'],
+                services=get_ec2_services(regions),
+                **common_params)
+        self._set_created_clusters(clusters)
 
-        self.loaders = LoaderSetAWS(
-            ec2_ami_id=self.params.get('ami_id_loader').split(),
-            ec2_ami_username=self.params.get('ami_loader_user'),
-            ec2_instance_type=loader_info['type'],
-            ec2_block_device_mappings=loader_info['device_mappings'],
-            n_nodes=loader_info['n_nodes'],
-            **common_params)
+        common_params['services'] = services
 
         if monitor_info['n_nodes'] > 0:
             self.monitors = MonitorSetAWS(
-                ec2_ami_id=self.params.get('ami_id_monitor').split(),
+                ec2_ami_id=ami_id_monitor,
                 ec2_ami_username=self.params.get('ami_monitor_user'),
                 ec2_instance_type=monitor_info['type'],
                 ec2_block_device_mappings=monitor_info['device_mappings'],
@@ -852,6 +896,23 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         else:
             self.monitors = NoMonitorSet()
 
+    def _set_created_clusters(self, clusters):
+        """
+        Set cluster attributes from futures of parallel creation
+
+        All successfully created clusters are set before an error is raised, to have them cleaned up on teardown.
+        :param clusters: dictionary of attribute name to future of cluster creation
+        """
+        wait_futures(clusters.values())
+        errors = []
+        for attr, future in clusters.items():
+            if future.exception() is None:
+                setattr(self, attr, future.result())
+            else:
+                errors.append(future.exception())
+        if errors:
+            raise errors[0]
+
     def get_cluster_docker(self):
         self.credentials.append(UserRemoteCredentials(key_file=self.params.get('user_credentials_path')))
 
@@ -1068,8 +1129,8 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
             if Setup.INTRA_NODE_COMM_PUBLIC:
                 ip = ','.join(self.db_cluster.get_node_public_ips())
             else:
-                ip = self.db_cluster.get_node_private_ips()[0]
-            stress_cmd = '%s -node %s' % (stress_cmd, ip)
+                ip = self.db_cluster.nodes[0].private_ip_address
+            stress_cmd = f'{stress_cmd} -node {ip}'
         return stress_cmd
 
     def run_stress(self, stress_cmd, duration=None):
@@ -1107,6 +1168,9 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                                     round_robin=False, stats_aggregate_cmds=True, keyspace_name=None, use_single_loader=False,  # pylint: disable=too-many-arguments,unused-argument
                                     stop_test_on_failure=True):  # pylint: disable=too-many-arguments,unused-argument
         # stress_cmd = self._cs_add_node_flag(stress_cmd)
+        if not CS_RATE_THREADS_REGEX.search(stress_cmd):
+            self.log.warning("Stress command doesn't specify `-rate threads=N', cassandra-stress will run it several "
+                             "times with auto-scaled threads count: %s", stress_cmd)
         timeout = self.get_duration(duration)
         if self.create_stats:
             self.update_stress_cmd_details(stress_cmd, prefix, stresser="cassandra-stress",
@@ -1589,7 +1653,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
 
     @staticmethod
     def rows_to_list(rows):
-        return [list(row) for row in rows]
+        return rows_to_list(rows)
 
     def copy_table(self, node, src_keyspace, src_table, dest_keyspace, dest_table, columns_list=None, copy_data=False):  # pylint: disable=too-many-arguments
         """
@@ -1953,14 +2017,16 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
 
         actions_per_cluster_type = get_post_behavior_actions(self.params)
         critical_events = get_testrun_status(Setup.test_id(), self.logdir, only_critical=True)
+        clusters_to_destroy = []
+        attrs_to_reset = []
         if self.db_cluster is not None:
             action = actions_per_cluster_type['db_nodes']['action']
             self.log.info("Action for db nodes is %s", action)
             if (action == 'destroy') or (action == 'keep-on-failure' and not critical_events):
-                self.destroy_cluster(self.db_cluster)
-                self.db_cluster = None
+                clusters_to_destroy.append(self.db_cluster)
+                attrs_to_reset.append('db_cluster')
                 if self.cs_db_cluster:
-                    self.destroy_cluster(self.cs_db_cluster)
+                    clusters_to_destroy.append(self.cs_db_cluster)
             elif action == 'keep-on-failure' and critical_events:
                 self.log.info('Critical errors found. Set keep flag for db nodes')
                 Setup.keep_cluster(node_type='db_nodes', val='keep')
@@ -1972,8 +2038,8 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
             action = actions_per_cluster_type['loader_nodes']['action']
             self.log.info("Action for loader nodes is %s", action)
             if (action == 'destroy') or (action == 'keep-on-failure' and not critical_events):
-                self.destroy_cluster(self.loaders)
-                self.loaders = None
+                clusters_to_destroy.append(self.loaders)
+                attrs_to_reset.append('loaders')
             elif action == 'keep-on-failure' and critical_events:
                 self.log.info('Critical errors found. Set keep flag for loader nodes')
                 Setup.keep_cluster(node_type='loader_nodes', val='keep')
@@ -1983,13 +2049,23 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
             action = actions_per_cluster_type['monitor_nodes']['action']
             self.log.info("Action for monitor nodes is %s", action)
             if (action == 'destroy') or (action == 'keep-on-failure' and not critical_events):
-                self.destroy_cluster(self.monitors)
-                self.monitors = None
+                clusters_to_destroy.append(self.monitors)
+                attrs_to_reset.append('monitors')
             elif action == 'keep-on-failure' and critical_events:
                 self.log.info('Critical errors found. Set keep flag for monitor nodes')
                 Setup.keep_cluster(node_type='monitor_nodes', val='keep')
                 self.set_keep_alive_on_failure(self.monitors)
 
+        if clusters_to_destroy:
+            # Clusters are independent, so wait for their termination in parallel.  destroy_cluster() is silenced,
+            # hence a failure of one cluster doesn't abort destroying of the others.
+            with ThreadPoolExecutor(max_workers=len(clusters_to_destroy),
+                                    thread_name_prefix="DestroyClusterThread") as executor:
+                for cluster in clusters_to_destroy:
+                    executor.submit(self.destroy_cluster, cluster)
+        for attr in attrs_to_reset:
+            setattr(self, attr, None)
+
         self.destroy_credentials()
 
     def tearDown(self):
@@ -2013,6 +2089,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         self.stop_event_device()
         if self.params.get('collect_logs'):
             self.collect_sct_logs()
+        self.stop_stats_updates()
         self.finalize_teardown()
         self.log.info('Test ID: {}'.format(Setup.test_id()))
         self._check_alive_routines_and_report_them()
@@ -2069,6 +2146,10 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
             if self.create_stats:
                 self.update({'test_details': {'log_files': {'job_log': s3_link}}})
 
+    @silence()
+    def stop_stats_updates(self):
+        self.close()
+
     @silence()
     def stop_event_device(self):  # pylint: disable=no-self-use
         stop_events_device(_registry=self.events_processes_registry)
@@ -2223,6 +2304,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
             self.log.debug(f'collected latency are: {self.db_cluster.latency_results}')
             self.update({"latency_during_ops": self.db_cluster.latency_results})
             self.update_test_details()
+            self.wait_for_updates()
             results_analyzer.check_regression(test_id=self._test_id, data=self.db_cluster.latency_results)
 
     def check_regression(self):
@@ -2230,6 +2312,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                                                       send_email=self.params.get('send_email'),
                                                       email_recipients=self.params.get('email_recipients'))
         is_gce = bool(self.params.get('cluster_backend') == 'gce')
+        self.wait_for_updates()
         try:
             results_analyzer.check_regression(self._test_id, is_gce,
                                               email_subject_postfix=self.params.get('email_subject_postfix'))
@@ -2241,6 +2324,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
                                                       send_email=self.params.get('send_email'),
                                                       email_recipients=self.params.get('email_recipients'))
         is_gce = bool(self.params.get('cluster_backend') == 'gce')
+        self.wait_for_updates()
         try:
             results_analyzer.check_regression_with_subtest_baseline(self._test_id,
                                                                     base_test_id=Setup.test_id(),
@@ -2258,6 +2342,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
             email_postfix = self.params.get('email_subject_postfix')
             if email_postfix:
                 email_subject += ' - ' + email_postfix
+        self.wait_for_updates()
         try:
             return results_analyzer.check_regression_multi_baseline(
                 self._create_test_id(doc_id_with_timestamp=False),
@@ -2271,6 +2356,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         perf_analyzer = SpecifiedStatsPerformanceAnalyzer(es_index=self._test_index, es_doc_type=self._es_doc_type,
                                                           send_email=self.params.get('send_email'),
                                                           email_recipients=self.params.get('email_recipients'))
+        self.wait_for_updates()
         try:
             perf_analyzer.check_regression(self._test_id, stats)
         except Exception as ex:  # pylint: disable=broad-except
@@ -17,18 +17,18 @@ from __future__ import absolute_import
 
 import atexit
 import itertools
+import math
 import os
 import logging
 import random
 import re
 import socket
+import struct
 import time
 import datetime
 import errno
 import threading
-import select
 import shutil
-import copy
 import string
 import warnings
 import getpass
@@ -38,7 +38,7 @@ from typing import Iterable, List, Callable, Optional, Dict, Union, Literal
 from urllib.parse import urlparse
 from unittest.mock import Mock
 
-from functools import wraps, cached_property
+from functools import wraps, cached_property, lru_cache
 from collections import defaultdict, namedtuple
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
@@ -48,6 +48,7 @@ import hashlib
 import boto3
 from mypy_boto3_s3 import S3Client, S3ServiceResource
 from mypy_boto3_ec2 import EC2Client, EC2ServiceResource
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import docker  # pylint: disable=wrong-import-order; false warning because of docker import (local file vs. package)
 import libcloud.storage.providers
@@ -61,12 +62,39 @@ from sdcm.utils.ssh_agent import SSHAgent
 from sdcm.utils.decorators import retrying
 from sdcm import wait
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 LOGGER = logging.getLogger('utils')
 DEFAULT_AWS_REGION = "eu-west-1"
+AWS_REGIONS = (
+    'eu-north-1',
+    'ap-south-1',
+    'eu-west-3',
+    'eu-west-2',
+    'eu-west-1',
+    'ap-northeast-2',
+    'ap-northeast-1',
+    'sa-east-1',
+    'ca-central-1',
+    'ap-southeast-1',
+    'ap-southeast-2',
+    'eu-central-1',
+    'us-east-1',
+    'us-east-2',
+    'us-west-1',
+    'us-west-2',
+)
 DOCKER_CGROUP_RE = re.compile("/docker/([0-9a-f]+)")
 SCYLLA_AMI_OWNER_ID = "797456418907"
 MAX_SPOT_DURATION_TIME = 360
+EC2_TERMINATE_INSTANCES_BATCH_SIZE = 1000  # max number of instance IDs AWS accepts in one TerminateInstances request
+EIP_RELEASE_WORKERS = 16
+S3_DOWNLOAD_DIR_WORKERS = 10  # don't exceed the default connection pool size of boto3 clients
+GCE_DOWNLOAD_DIR_WORKERS = 10
 SCYLLA_YAML_PATH = "/etc/scylla/scylla.yaml"
 
 
@@ -74,8 +102,46 @@ def deprecation(message):
     warnings.warn(message, DeprecationWarning, stacklevel=3)
 
 
+_BOTO3_SESSION_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_boto3_session() -> boto3.session.Session:
+    return boto3.session.Session()
+
+
+def get_boto3_resource(service_name, **kwargs):
+    """Create boto3 resource using the shared session, which keeps service models loaded between calls.
+
+    Resources aren't thread-safe, so a new one is created on each call.
+    """
+    with _BOTO3_SESSION_LOCK:
+        return _get_boto3_session().resource(service_name, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def get_boto3_client(service_name, region_name=None):
+    """Get boto3 client shared by all callers (clients are thread-safe, but their creation isn't.)"""
+    with _BOTO3_SESSION_LOCK:
+        return _get_boto3_session().client(service_name, region_name=region_name)
+
+
+def _local_file_hash(file_path, algorithm='md5'):
+    file_hash = hashlib.new(algorithm)
+    buffer = bytearray(1024 * 1024)
+    view = memoryview(buffer)
+    with open(file_path, 'rb') as file_obj:
+        while size := file_obj.readinto(buffer):
+            file_hash.update(view[:size])
+    return file_hash.hexdigest()
+
+
 def _remote_get_hash(remoter, file_path):
+    from sdcm.remote import LocalCmdRunner  # pylint: disable=import-outside-toplevel
+
     try:
+        if isinstance(remoter, LocalCmdRunner):
+            return _local_file_hash(os.path.expanduser(file_path))
         result = remoter.run('md5sum {}'.format(file_path), verbose=True)
         return result.stdout.strip().split()[0]
     except Exception as details:  # pylint: disable=broad-except
@@ -94,10 +160,16 @@ def remote_get_file(remoter, src, dst, hash_expected=None, retries=1, user_agent
     _remote_get_file(remoter, src, dst, user_agent)
     if not hash_expected:
         return
-    while retries > 0 and _remote_get_hash(remoter, dst) != hash_expected:
+    while _remote_get_hash(remoter, dst) != hash_expected:
+        assert retries > 0, f"Hash of {dst} downloaded from {src} doesn't match {hash_expected}"
         _remote_get_file(remoter, src, dst, user_agent)
         retries -= 1
-    assert _remote_get_hash(remoter, dst) == hash_expected
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_cached(path, mtime_ns):  # pylint: disable=unused-argument; mtime_ns is a part of the cache key
+    with open(path, 'r') as yaml_stream:
+        return yaml.load(yaml_stream, Loader=YamlSafeLoader)
 
 
 def get_profile_content(stress_cmd):
@@ -105,7 +177,7 @@ def get_profile_content(stress_cmd):
     Looking profile yaml in data_dir or the path as is to get the user profile
     and loading it's yaml
 
-    :return: (profile_filename, dict with yaml)
+    :return: (profile_filename, dict with yaml), the dict is cached and shared between callers, don't modify it
     """
 
     cs_profile = re.search(r'profile=(.*\.yaml)', stress_cmd).group(1)
@@ -115,14 +187,12 @@ def get_profile_content(stress_cmd):
     elif not os.path.exists(cs_profile):
         raise FileNotFoundError('User profile file {} not found'.format(cs_profile))
 
-    with open(cs_profile, 'r') as yaml_stream:
-        profile = yaml.safe_load(yaml_stream)
-    return cs_profile, profile
+    return cs_profile, _load_yaml_cached(cs_profile, os.stat(cs_profile).st_mtime_ns)
 
 
 def generate_random_string(length):
     return random.choice(string.ascii_uppercase) + ''.join(
-        random.choice(string.ascii_uppercase + string.digits) for x in range(length - 1))
+        random.choices(string.ascii_uppercase + string.digits, k=length - 1))
 
 
 def get_data_dir_path(*args):
@@ -131,6 +201,7 @@ def get_data_dir_path(*args):
     return os.path.abspath(data_dir)
 
 
+@lru_cache(maxsize=None)
 def get_sct_root_path():
     import sdcm  # pylint: disable=import-outside-toplevel
     sdcm_path = os.path.realpath(sdcm.__path__[0])
@@ -155,49 +226,56 @@ def get_test_name():
     return ""
 
 
+def _repo_file_line_regex(body_prefixes):
+    # A valid line is either blank or starts with one of the prefixes.
+    return re.compile(r"\s*$|" + "|".join(map(re.escape, body_prefixes)))
+
+
+RHEL_REPO_FILE_LINE_REGEX = _repo_file_line_regex(
+    ('#', '[scylla', 'name=', 'baseurl=', 'enabled=', 'gpgcheck=', 'type=',
+     'skip_if_unavailable=', 'gpgkey=', 'repo_gpgcheck=', 'enabled_metadata=', ))
+DEB_REPO_FILE_LINE_REGEX = _repo_file_line_regex(('#', 'deb', ))
+
+
 def verify_scylla_repo_file(content, is_rhel_like=True):
     LOGGER.info('Verifying Scylla repo file')
-    if is_rhel_like:
-        body_prefix = ['#', '[scylla', 'name=', 'baseurl=', 'enabled=', 'gpgcheck=', 'type=',
-                       'skip_if_unavailable=', 'gpgkey=', 'repo_gpgcheck=', 'enabled_metadata=']
-    else:
-        body_prefix = ['#', 'deb']
+    line_regex = RHEL_REPO_FILE_LINE_REGEX if is_rhel_like else DEB_REPO_FILE_LINE_REGEX
     for line in content.split('\n'):
-        valid_prefix = False
-        for prefix in body_prefix:
-            if line.startswith(prefix) or not line.strip():
-                valid_prefix = True
-                break
         LOGGER.debug(line)
-        assert valid_prefix, 'Repository content has invalid line: {}'.format(line)
+        assert line_regex.match(line), 'Repository content has invalid line: {}'.format(line)
 
 
 class S3Storage():
 
     bucket_name = 'cloudius-jenkins-test'
     enable_multipart_threshold_size = 1024 * 1024 * 1024  # 1GB
-    multipart_chunksize = 50 * 1024 * 1024  # 50 MB
+    multipart_chunksize = 64 * 1024 * 1024  # 64 MB
+    max_concurrency = 32
+    io_chunksize = 1024 * 1024  # 1 MB
     num_download_attempts = 5
 
     def __init__(self, bucket=None):
         if bucket:
             self.bucket_name = bucket
-        self._bucket: S3ServiceResource.Bucket = boto3.resource("s3").Bucket(name=self.bucket_name)
+        # Connection pool should be large enough for all transfer threads.
+        s3_resource = get_boto3_resource("s3", config=Config(max_pool_connections=self.max_concurrency))
+        self._bucket: S3ServiceResource.Bucket = s3_resource.Bucket(name=self.bucket_name)
         self.transfer_config = boto3.s3.transfer.TransferConfig(multipart_threshold=self.enable_multipart_threshold_size,
                                                                 multipart_chunksize=self.multipart_chunksize,
+                                                                max_concurrency=self.max_concurrency,
+                                                                io_chunksize=self.io_chunksize,
+                                                                use_threads=True,
                                                                 num_download_attempts=self.num_download_attempts)
 
     def get_s3_fileojb(self, key):
-        objects = []
-        for obj in self._bucket.objects.filter(Prefix=key):
-            objects.append(obj)
-        return objects
+        return list(self._bucket.objects.filter(Prefix=key))
 
     def search_by_path(self, path=''):
-        files = []
-        for obj in self._bucket.objects.filter(Prefix=path):
-            files.append(obj.key)
-        return files
+        """Iterate over keys of all objects under `path' prefix, fetching them page by page."""
+        paginator = self._bucket.meta.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=path, PaginationConfig={'PageSize': 1000}):
+            for obj in page.get('Contents', ()):
+                yield obj['Key']
 
     def generate_url(self, file_path, dest_dir=''):
         bucket_name = self.bucket_name
@@ -223,9 +301,10 @@ class S3Storage():
             return ""
 
     def set_public_access(self, key):
-        acl_obj: S3ServiceResource = boto3.resource('s3').ObjectAcl(self.bucket_name, key)
+        acl_obj: S3ServiceResource = self._bucket.Object(key).Acl()
 
-        grants = copy.deepcopy(acl_obj.grants)
+        # Only the list is extended, existing grants aren't modified.
+        grants = list(acl_obj.grants)
         grantees = {
             'Grantee': {
                 "Type": "Group",
@@ -262,21 +341,30 @@ def get_latest_gemini_version():
     return latest_version.public
 
 
+TEST_LOG_TYPES = ('db-cluster', 'monitor-set', 'loader-set', 'sct-runner', 'jepsen-data',
+                  'prometheus', 'grafana',
+                  'job', 'monitoring_data_stack', 'events', )
+TEST_LOG_TYPES_REGEX = re.compile("|".join(map(re.escape, TEST_LOG_TYPES)))
+TEST_LOG_DATE_FORMATS = ("%Y%m%d_%H%M%S", "%Y_%m_%d_%H_%M_%S", )
+# Zero-padded forms of TEST_LOG_DATE_FORMATS (`_' is either between all fields or between date and time only.)
+TEST_LOG_DATE_REGEX = re.compile(r"(\d{4})(_?)(\d{2})\2(\d{2})_(\d{2})\2(\d{2})\2(\d{2})")
+
+
 def list_logs_by_test_id(test_id):
-    log_types = ['db-cluster', 'monitor-set', 'loader-set', 'sct-runner', 'jepsen-data',
-                 'prometheus', 'grafana',
-                 'job', 'monitoring_data_stack', 'events']
     results = []
 
     if not test_id:
         return results
 
     def convert_to_date(date_str):
-        time_formats = [
-            "%Y%m%d_%H%M%S",
-            "%Y_%m_%d_%H_%M_%S",
-        ]
-        for time_format in time_formats:
+        # Fast path for dates in a canonical form, strptime() is quite slow.
+        if match := TEST_LOG_DATE_REGEX.fullmatch(date_str):
+            year, _, month, day, hour, minute, second = match.groups()
+            try:
+                return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+            except ValueError:
+                pass
+        for time_format in TEST_LOG_DATE_FORMATS:
             try:
                 return datetime.datetime.strptime(date_str, time_format)
             except ValueError:
@@ -287,42 +375,34 @@ def list_logs_by_test_id(test_id):
 
     log_files = S3Storage().search_by_path(path=test_id)
     for log_file in log_files:
-        for log_type in log_types:
-            if log_type in log_file:
-                results.append({"file_path": log_file,
-                                "type": log_type,
-                                "link": "https://{}.s3.amazonaws.com/{}".format(S3Storage.bucket_name, log_file),
-                                "date": convert_to_date(log_file.split('/')[1])
-                                })
-                break
+        if found_log_types := TEST_LOG_TYPES_REGEX.findall(log_file):
+            # Keep the priority of TEST_LOG_TYPES order if a path matches a few log types.
+            log_type = min(found_log_types, key=TEST_LOG_TYPES.index)
+            results.append({"file_path": log_file,
+                            "type": log_type,
+                            "link": "https://{}.s3.amazonaws.com/{}".format(S3Storage.bucket_name, log_file),
+                            "date": convert_to_date(log_file.split('/')[1])
+                            })
     results = sorted(results, key=lambda x: x["date"])
 
     return results
 
 
+@lru_cache(maxsize=None)
+def _describe_aws_regions():
+    client: EC2Client = get_boto3_client('ec2', region_name=DEFAULT_AWS_REGION)
+    return tuple(region['RegionName'] for region in client.describe_regions()['Regions'])
+
+
 def all_aws_regions(cached=False):
+    """Get names of AWS regions.
+
+    :param cached: return the hardcoded list of regions instead of asking AWS (e.g., to not go to network on import)
+    """
     if cached:
-        return [
-            'eu-north-1',
-            'ap-south-1',
-            'eu-west-3',
-            'eu-west-2',
-            'eu-west-1',
-            'ap-northeast-2',
-            'ap-northeast-1',
-            'sa-east-1',
-            'ca-central-1',
-            'ap-southeast-1',
-            'ap-southeast-2',
-            'eu-central-1',
-            'us-east-1',
-            'us-east-2',
-            'us-west-1',
-            'us-west-2'
-        ]
-    else:
-        client: EC2Client = boto3.client('ec2', region_name=DEFAULT_AWS_REGION)
-        return [region['RegionName'] for region in client.describe_regions()['Regions']]
+        return list(AWS_REGIONS)
+    # Regions available to the account don't change during a run, so ask AWS only once.
+    return list(_describe_aws_regions())
 
 
 class ParallelObject:
@@ -342,13 +422,15 @@ class ParallelObject:
                 if item in object is any other type, will be passed to func as is.
                 if function accept list as parameter, the item shuld be list of list item = [[]]
 
-        :param timeout: global timeout for running all
-        :param num_workers: num of parallel threads, defaults to None
+        :param timeout: global timeout for running all, when there are more objects than workers
+                it's given to each wave of `num_workers' calls
+        :param num_workers: num of parallel threads, defaults to ThreadPoolExecutor's default
         :param disable_logging: disable logging for running func, defaults to False
         """
         self.objects = objects
         self.timeout = timeout
-        self.num_workers = num_workers
+        # Same default as ThreadPoolExecutor has.
+        self.num_workers = num_workers or min(32, (os.cpu_count() or 1) + 4)
         self.disable_logging = disable_logging
         self._thread_pool = ThreadPoolExecutor(max_workers=self.num_workers)
 
@@ -376,44 +458,49 @@ class ParallelObject:
             @wraps(fun)
             def inner(*args, **kwargs):
                 thread_name = threading.current_thread().name
-                fun_args = args
-                fun_kwargs = kwargs
-                fun_name = fun.__name__
-                LOGGER.debug("[{thread_name}] {fun_name}({fun_args}, {fun_kwargs})".format(thread_name=thread_name,
-                                                                                           fun_name=fun_name,
-                                                                                           fun_args=fun_args,
-                                                                                           fun_kwargs=fun_kwargs))
+                # Args can be large (e.g., cloud API responses), so let logging format them only if needed.
+                LOGGER.debug("[%s] %s(%s, %s)", thread_name, fun.__name__, args, kwargs)
                 return_val = fun(*args, **kwargs)
-                LOGGER.debug("[{thread_name}] Done.".format(thread_name=thread_name))
+                LOGGER.debug("[%s] Done.", thread_name)
                 return return_val
             return inner
 
         results = []
 
         if not self.disable_logging:
-            LOGGER.debug("Executing in parallel: '{}' on {}".format(func.__name__, self.objects))
+            LOGGER.debug("Executing in parallel: '%s' on %s", func.__name__, self.objects)
             func = func_wrap(func)
 
-        futures = []
+        futures = {}
 
         for obj in self.objects:
             if unpack_objects and isinstance(obj, (list, tuple)):
-                futures.append(self._thread_pool.submit(func, *obj))
+                future = self._thread_pool.submit(func, *obj)
             elif unpack_objects and isinstance(obj, dict):
-                futures.append(self._thread_pool.submit(func, **obj))
+                future = self._thread_pool.submit(func, **obj)
             else:
-                futures.append(self._thread_pool.submit(func, obj))
+                future = self._thread_pool.submit(func, obj)
+            futures[future] = (len(futures), obj)
+
         time_out = self.timeout
-        for obj_idx, future in enumerate(futures):
-            try:
-                result = future.result(time_out)
-            except FuturesTimeoutError as exception:
-                results.append(ParallelObjectResult(obj=self.objects[obj_idx], exc=exception, result=None))
-                time_out = 0.001  # if there was a timeout on one of the futures there is no need to wait for all
-            except Exception as exception:  # pylint: disable=broad-except
-                results.append(ParallelObjectResult(obj=self.objects[obj_idx], exc=exception, result=None))
-            else:
-                results.append(ParallelObjectResult(obj=self.objects[obj_idx], exc=None, result=result))
+        if time_out is not None:
+            # Calls which don't fit into the pool wait for free workers, so give `timeout' to each wave of calls.
+            time_out *= math.ceil(len(futures) / self.num_workers)
+
+        results = [None] * len(futures)
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=time_out):
+                obj_idx, obj = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exception:  # pylint: disable=broad-except
+                    results[obj_idx] = ParallelObjectResult(obj=obj, exc=exception, result=None)
+                else:
+                    results[obj_idx] = ParallelObjectResult(obj=obj, exc=None, result=result)
+        except FuturesTimeoutError as exception:
+            for obj_idx, obj in futures.values():
+                if results[obj_idx] is None:
+                    results[obj_idx] = ParallelObjectResult(obj=obj, exc=exception, result=None)
 
         self.clean_up(futures)
 
@@ -482,6 +569,7 @@ def clean_cloud_resources(tags_dict, dry_run=False):
     return True
 
 
+@lru_cache(maxsize=None)
 def docker_current_container_id() -> Optional[str]:
     with open("/proc/1/cgroup") as cgroup:
         for line in cgroup:
@@ -617,11 +705,11 @@ def clean_resources_docker(tags_dict: dict, builder_name: Optional[str] = None,
 
 
 def aws_tags_to_dict(tags_list):
-    tags_dict = {}
-    if tags_list:
-        for item in tags_list:
-            tags_dict[item["Key"]] = item["Value"]
-    return tags_dict
+    return {item["Key"]: item["Value"] for item in tags_list} if tags_list else {}
+
+
+def _aws_tag_value(instance, key, default=None):
+    return next((tag["Value"] for tag in instance.get("Tags", ()) if tag["Key"] == key), default)
 
 
 def list_instances_aws(tags_dict=None, region_name=None, running=False, group_as_region=False, verbose=False):
@@ -638,30 +726,24 @@ def list_instances_aws(tags_dict=None, region_name=None, running=False, group_as
     """
     instances = {}
     aws_regions = [region_name] if region_name else all_aws_regions()
+    custom_filter = [{'Name': 'tag:{}'.format(key), 'Values': [value]} for key, value in (tags_dict or {}).items()]
+
+    def is_listed(state):
+        return state == 'running' if running else state != 'terminated'
 
     def get_instances(region):
         if verbose:
             LOGGER.info('Going to list aws region "%s"', region)
-        time.sleep(random.random())
-        client: EC2Client = boto3.client('ec2', region_name=region)
-        custom_filter = []
-        if tags_dict:
-            custom_filter = [{'Name': 'tag:{}'.format(key), 'Values': [value]} for key, value in tags_dict.items()]
+        client: EC2Client = get_boto3_client('ec2', region_name=region)
         response = client.describe_instances(Filters=custom_filter)
-        instances[region] = [instance for reservation in response['Reservations'] for instance in reservation[
-            'Instances']]
+        instances[region] = [instance for reservation in response['Reservations']
+                             for instance in reservation['Instances'] if is_listed(instance['State']['Name'])]
 
         if verbose:
-            LOGGER.info("%s: done [%s/%s]", region, len(list(instances.keys())), len(aws_regions))
+            LOGGER.info("%s: done [%s/%s]", region, len(instances), len(aws_regions))
 
     ParallelObject(aws_regions, timeout=100).run(get_instances, ignore_exceptions=True)
 
-    for curr_region_name in instances:
-        if running:
-            instances[curr_region_name] = [i for i in instances[curr_region_name] if i['State']['Name'] == 'running']
-        else:
-            instances[curr_region_name] = [i for i in instances[curr_region_name]
-                                           if not i['State']['Name'] == 'terminated']
     if not group_as_region:
         instances = list(itertools.chain(*list(instances.values())))  # flatten the list of lists
         total_items = len(instances)
@@ -674,6 +756,14 @@ def list_instances_aws(tags_dict=None, region_name=None, running=False, group_as
     return instances
 
 
+def terminate_instances_aws(client: EC2Client, instance_ids: List[str]) -> None:
+    """Terminate EC2 instances using as few TerminateInstances requests as possible."""
+
+    for idx in range(0, len(instance_ids), EC2_TERMINATE_INSTANCES_BATCH_SIZE):
+        response = client.terminate_instances(InstanceIds=instance_ids[idx:idx + EC2_TERMINATE_INSTANCES_BATCH_SIZE])
+        LOGGER.debug("Done. Result: %s\n", response['TerminatingInstances'])
+
+
 def clean_instances_aws(tags_dict, dry_run=False):
     """Remove all instances with specific tags in AWS."""
 
@@ -684,7 +774,7 @@ def clean_instances_aws(tags_dict, dry_run=False):
         if not instance_list:
             LOGGER.info("There are no instances to remove in AWS region %s", region)
             continue
-        client: EC2Client = boto3.client('ec2', region_name=region)
+        instance_ids = []
         for instance in instance_list:
             tags = aws_tags_to_dict(instance.get('Tags'))
             name = tags.get("Name", "N/A")
@@ -694,21 +784,14 @@ def clean_instances_aws(tags_dict, dry_run=False):
                 LOGGER.info(f"Skipping Sct Runner instance '{instance_id}'")
                 continue
             LOGGER.info("Going to delete '{instance_id}' [name={name}] ".format(instance_id=instance_id, name=name))
-            if not dry_run:
-                response = client.terminate_instances(InstanceIds=[instance_id])
-                LOGGER.debug("Done. Result: %s\n", response['TerminatingInstances'])
+            instance_ids.append(instance_id)
+        if instance_ids and not dry_run:
+            terminate_instances_aws(get_boto3_client('ec2', region_name=region), instance_ids)
 
 
 def clean_sct_runners():
     LOGGER.info("Looking for SCT runner instances...")
-    all_instances = list_instances_aws(verbose=True)
-    sct_runners = []
-
-    for instance in all_instances:
-        tags = aws_tags_to_dict(instance.get('Tags'))
-        node_type = tags.get("NodeType", "")
-        if node_type == "sct-runner":
-            sct_runners.append(instance)
+    sct_runners = list_instances_aws(tags_dict={"NodeType": "sct-runner"}, verbose=True)
     if sct_runners:
         runners_info = []
         for i in sct_runners:
@@ -721,7 +804,7 @@ def clean_sct_runners():
 
     utc_now = datetime.datetime.now(tz=datetime.timezone.utc)
     LOGGER.info("UTC now: %s", utc_now)
-    runners_cleaned = []
+    runners_to_clean = defaultdict(list)
     for sct_runner in sct_runners:
         tags = aws_tags_to_dict(sct_runner.get('Tags'))
         keep = tags.get("keep", "")
@@ -742,13 +825,12 @@ def clean_sct_runners():
         if not keep or seconds_running > keep_hours * 3600:
             LOGGER.info(f"[{region}] Runner instance '{instance_id}'<keep={keep}> that launched at '{launch_time}' UTC "
                         f"is unused/expired, cleaning ...")
-            client = boto3.client('ec2', region_name=region)
-            response = client.terminate_instances(InstanceIds=[sct_runner['InstanceId']])
-            LOGGER.info("Done.")
-            LOGGER.debug("Result: %s\n", response['TerminatingInstances'])
-            runners_cleaned.append(sct_runner)
-    if runners_cleaned:
-        LOGGER.info("Cleaned '%s' runners.", len(runners_cleaned))
+            runners_to_clean[region].append(instance_id)
+    for region, instance_ids in runners_to_clean.items():
+        terminate_instances_aws(get_boto3_client('ec2', region_name=region), instance_ids)
+        LOGGER.info("[%s] Done.", region)
+    if runners_to_clean:
+        LOGGER.info("Cleaned '%s' runners.", sum(len(instance_ids) for instance_ids in runners_to_clean.values()))
     else:
         LOGGER.info("There are no runners to clean.")
 
@@ -766,25 +848,22 @@ def list_elastic_ips_aws(tags_dict=None, region_name=None, group_as_region=False
     """
     elastic_ips = {}
     aws_regions = [region_name] if region_name else all_aws_regions()
+    custom_filter = [{'Name': 'tag:{}'.format(key), 'Values': [value]} for key, value in (tags_dict or {}).items()]
 
     def get_elastic_ips(region):
         if verbose:
             LOGGER.info('Going to list aws region "%s"', region)
-        time.sleep(random.random())
-        client: EC2Client = boto3.client('ec2', region_name=region)
-        custom_filter = []
-        if tags_dict:
-            custom_filter = [{'Name': 'tag:{}'.format(key), 'Values': [value]} for key, value in tags_dict.items()]
+        client: EC2Client = get_boto3_client('ec2', region_name=region)
         response = client.describe_addresses(Filters=custom_filter)
         elastic_ips[region] = response['Addresses']
         if verbose:
-            LOGGER.info("%s: done [%s/%s]", region, len(list(elastic_ips.keys())), len(aws_regions))
+            LOGGER.info("%s: done [%s/%s]", region, len(elastic_ips), len(aws_regions))
 
     ParallelObject(aws_regions, timeout=100).run(get_elastic_ips, ignore_exceptions=True)
 
     if not group_as_region:
         elastic_ips = list(itertools.chain(*list(elastic_ips.values())))  # flatten the list of lists
-        total_items = elastic_ips
+        total_items = len(elastic_ips)
     else:
         total_items = sum([len(value) for _, value in elastic_ips.items()])
     if verbose:
@@ -802,32 +881,50 @@ def clean_elastic_ips_aws(tags_dict, dry_run=False):
     assert tags_dict, "tags_dict not provided (can't clean all instances)"
     aws_instances = list_elastic_ips_aws(tags_dict=tags_dict, group_as_region=True)
 
+    def release_eip(client: EC2Client, eip: dict) -> None:
+        association_id = eip.get('AssociationId')
+        if association_id and not dry_run:
+            response = client.disassociate_address(AssociationId=association_id)
+            LOGGER.debug("disassociate_address. Result: %s\n", response)
+        allocation_id = eip['AllocationId']
+        LOGGER.info("Going to release '%s' [public_ip={%s}]", allocation_id, eip['PublicIp'])
+        if not dry_run:
+            response = client.release_address(AllocationId=allocation_id)
+            LOGGER.debug("Done. Result: %s\n", response)
+
+    # There is no batch API for EIPs, so release them in parallel.
+    eips_to_release = []
     for region, eip_list in aws_instances.items():
         if not eip_list:
             LOGGER.info("There are no EIPs to remove in AWS region %s", region)
             continue
-        client: EC2Client = boto3.client('ec2', region_name=region)
-        for eip in eip_list:
-            association_id = eip.get('AssociationId')
-            if association_id and not dry_run:
-                response = client.disassociate_address(AssociationId=association_id)
-                LOGGER.debug("disassociate_address. Result: %s\n", response)
-            allocation_id = eip['AllocationId']
-            LOGGER.info("Going to release '%s' [public_ip={%s}]", allocation_id, eip['PublicIp'])
-            if not dry_run:
-                response = client.release_address(AllocationId=allocation_id)
-                LOGGER.debug("Done. Result: %s\n", response)
+        client: EC2Client = get_boto3_client('ec2', region_name=region)
+        eips_to_release.extend((client, eip) for eip in eip_list)
 
+    if eips_to_release:
+        ParallelObject(eips_to_release, timeout=None, num_workers=min(len(eips_to_release), EIP_RELEASE_WORKERS)) \
+            .run(release_eip, unpack_objects=True)
 
-def get_gce_driver():
+
+@lru_cache(maxsize=None)
+def _get_gcp_credentials():
     # avoid cyclic dependency issues, since too many things import utils.py
     from sdcm.keystore import KeyStore
 
-    gcp_credentials = KeyStore().get_gcp_credentials()
-    gce_driver = get_driver(Provider.GCE)
+    return KeyStore().get_gcp_credentials()
+
 
-    return gce_driver(gcp_credentials["project_id"] + "@appspot.gserviceaccount.com",
-                      gcp_credentials["private_key"], project=gcp_credentials["project_id"])
+# libcloud drivers aren't thread-safe, so every thread gets a driver of its own.
+_GCE_DRIVERS = threading.local()
+
+
+def get_gce_driver():
+    if not hasattr(_GCE_DRIVERS, "driver"):
+        gcp_credentials = _get_gcp_credentials()
+        gce_driver = get_driver(Provider.GCE)
+        _GCE_DRIVERS.driver = gce_driver(gcp_credentials["project_id"] + "@appspot.gserviceaccount.com",
+                                         gcp_credentials["private_key"], project=gcp_credentials["project_id"])
+    return _GCE_DRIVERS.driver
 
 
 def get_all_gce_regions():
@@ -849,13 +946,11 @@ def gce_meta_to_dict(metadata):
 
 
 def filter_gce_by_tags(tags_dict, instances):
-    filtered_instances = []
-    for instance in instances:
+    def tags_match(instance):
         tags = gce_meta_to_dict(instance.extra['metadata'])
-        found_keys = set(k for k in tags_dict if k in tags and tags_dict[k] == tags[k])
-        if found_keys == set(tags_dict.keys()):
-            filtered_instances.append(instance)
-    return filtered_instances
+        return all(key in tags and tags[key] == value for key, value in tags_dict.items())
+
+    return [instance for instance in instances if tags_match(instance)]
 
 
 def list_instances_gce(tags_dict=None, running=False, verbose=False):
@@ -904,12 +999,38 @@ def list_static_ips_gce(region_name="all", group_by_region=False, verbose=False)
     return all_static_ips
 
 
-def list_clusters_gke(tags_dict: Optional[dict] = None, verbose: bool = False) -> list:
+@lru_cache(maxsize=None)
+def _get_gke_cleaner():
+    """Return a process-wide holder of a gcloud container, started once and removed at exit."""
+
     from sdcm.utils.docker_utils import ContainerManager
     from sdcm.utils.gce_utils import GcloudContainerMixin
 
+    class GkeCleaner(GcloudContainerMixin):
+        name = f"gke-cleaner-{uuid.uuid4()!s:.8}"
+        _containers = {}
+        tags = {}
+
+        def list_gke_clusters(self) -> list:
+            try:
+                output = self.gcloud.run("container clusters list --format json")
+            except Exception as exc:
+                LOGGER.error("`gcloud container clusters list --format json' failed to run: %s", exc)
+            else:
+                try:
+                    return json.loads(output)
+                except json.JSONDecodeError as exc:
+                    LOGGER.error("Unable to parse output of `gcloud container clusters list --format json': %s", exc)
+            return []
+
+    cleaner = GkeCleaner()
+    atexit.register(ContainerManager.destroy_all_containers, cleaner)
+    return cleaner
+
+
+def list_clusters_gke(tags_dict: Optional[dict] = None, verbose: bool = False) -> list:
     class GkeCluster:
-        def __init__(self, cluster_info: dict, cleaner: "GkeCleaner"):
+        def __init__(self, cluster_info: dict, cleaner):
             self.cluster_info = cluster_info
             self.cleaner = cleaner
 
@@ -929,27 +1050,9 @@ def list_clusters_gke(tags_dict: Optional[dict] = None, verbose: bool = False) -
         def destroy(self):
             return self.cleaner.gcloud.run(f"container clusters delete {self.name} --zone {self.zone} --quiet")
 
-    class GkeCleaner(GcloudContainerMixin):
-        name = f"gke-cleaner-{uuid.uuid4()!s:.8}"
-        _containers = {}
-        tags = {}
-
-        def list_gke_clusters(self) -> list:
-            try:
-                output = self.gcloud.run("container clusters list --format json")
-            except Exception as exc:
-                LOGGER.error("`gcloud container clusters list --format json' failed to run: %s", exc)
-            else:
-                try:
-                    return [GkeCluster(info, self) for info in json.loads(output)]
-                except json.JSONDecodeError as exc:
-                    LOGGER.error("Unable to parse output of `gcloud container clusters list --format json': %s", exc)
-            return []
-
-        def __del__(self):
-            ContainerManager.destroy_all_containers(self)
-
-    clusters = GkeCleaner().list_gke_clusters()
+    # The gcloud container is reused by all calls, e.g. cleaning by post behavior lists clusters per node type.
+    cleaner = _get_gke_cleaner()
+    clusters = [GkeCluster(info, cleaner) for info in cleaner.list_gke_clusters()]
 
     if tags_dict:
         clusters = filter_gce_by_tags(tags_dict=tags_dict, instances=clusters)
@@ -1003,6 +1106,7 @@ def clean_clusters_gke(tags_dict: dict, dry_run: bool = False) -> None:
 
 
 _SCYLLA_AMI_CACHE = defaultdict(dict)
+_SCYLLA_AMI_CACHE_LOCKS = defaultdict(threading.Lock)
 
 
 def get_scylla_ami_versions(region):
@@ -1014,25 +1118,35 @@ def get_scylla_ami_versions(region):
     :rtype: list
     """
 
-    if _SCYLLA_AMI_CACHE[region]:
+    # Concurrent callers for the same region wait for a single DescribeImages request.
+    with _SCYLLA_AMI_CACHE_LOCKS[region]:
+        if _SCYLLA_AMI_CACHE[region]:
+            return _SCYLLA_AMI_CACHE[region]
+
+        client: EC2Client = get_boto3_client('ec2', region_name=region)
+        response = client.describe_images(
+            Owners=['797456418907'],  # ScyllaDB
+            Filters=[
+                {'Name': 'name', 'Values': ['ScyllaDB *']},
+            ],
+        )
+
+        _SCYLLA_AMI_CACHE[region] = sorted(response['Images'],
+                                           key=lambda x: x['CreationDate'],
+                                           reverse=True)
+
         return _SCYLLA_AMI_CACHE[region]
 
-    client: EC2Client = boto3.client('ec2', region_name=region)
-    response = client.describe_images(
-        Owners=['797456418907'],  # ScyllaDB
-        Filters=[
-            {'Name': 'name', 'Values': ['ScyllaDB *']},
-        ],
-    )
 
-    _SCYLLA_AMI_CACHE[region] = sorted(response['Images'],
-                                       key=lambda x: x['CreationDate'],
-                                       reverse=True)
+_S3_SCYLLA_REPOS_CACHE = defaultdict(dict)
+_S3_SCYLLA_REPOS_CACHE_LOCKS = defaultdict(threading.Lock)
 
-    return _SCYLLA_AMI_CACHE[region]
 
+def _s3_list_objects(s3_client: S3Client, **kwargs) -> Iterable[dict]:
+    """Iterate over all objects matching ListObjectsV2 `kwargs', not only the first 1000 of them."""
 
-_S3_SCYLLA_REPOS_CACHE = defaultdict(dict)
+    for page in s3_client.get_paginator('list_objects_v2').paginate(**kwargs):
+        yield from page.get('Contents', ())
 
 
 def get_s3_scylla_repos_mapping(dist_type='centos', dist_version=None):
@@ -1045,38 +1159,41 @@ def get_s3_scylla_repos_mapping(dist_type='centos', dist_version=None):
     :return: a mapping of versions prefixes to repos
     :rtype: dict
     """
-    if (dist_type, dist_version) in _S3_SCYLLA_REPOS_CACHE:
+    with _S3_SCYLLA_REPOS_CACHE_LOCKS[(dist_type, dist_version)]:
+        if (dist_type, dist_version) not in _S3_SCYLLA_REPOS_CACHE:
+            # Publish the mapping only when it's complete, so other threads never see a partial one.
+            _S3_SCYLLA_REPOS_CACHE[(dist_type, dist_version)] = _list_s3_scylla_repos(dist_type, dist_version)
         return _S3_SCYLLA_REPOS_CACHE[(dist_type, dist_version)]
 
-    s3_client: S3Client = boto3.client('s3', region_name=DEFAULT_AWS_REGION)
+
+def _list_s3_scylla_repos(dist_type, dist_version):
+    repos_mapping = {}
+    s3_client: S3Client = get_boto3_client('s3', region_name=DEFAULT_AWS_REGION)
     bucket = 'downloads.scylladb.com'
 
     if dist_type == 'centos':
-        response = s3_client.list_objects(Bucket=bucket, Prefix='rpm/centos/', Delimiter='/')
-
-        for repo_file in response['Contents']:
+        for repo_file in _s3_list_objects(s3_client, Bucket=bucket, Prefix='rpm/centos/', Delimiter='/'):
             filename = os.path.basename(repo_file['Key'])
             # only if path look like 'rpm/centos/scylla-1.3.repo', we deem it formal one
             if filename.startswith('scylla-') and filename.endswith('.repo'):
                 version_prefix = filename.replace('.repo', '').split('-')[-1]
-                _S3_SCYLLA_REPOS_CACHE[(
-                    dist_type, dist_version)][version_prefix] = "https://s3.amazonaws.com/{bucket}/{path}".format(bucket=bucket, path=repo_file['Key'])
+                repos_mapping[version_prefix] = "https://s3.amazonaws.com/{bucket}/{path}".format(
+                    bucket=bucket, path=repo_file['Key'])
 
     elif dist_type in ('ubuntu', 'debian'):
-        response = s3_client.list_objects(Bucket=bucket, Prefix='deb/{}/'.format(dist_type), Delimiter='/')
-        for repo_file in response['Contents']:
+        for repo_file in _s3_list_objects(s3_client, Bucket=bucket, Prefix='deb/{}/'.format(dist_type), Delimiter='/'):
             filename = os.path.basename(repo_file['Key'])
 
             # only if path look like 'deb/debian/scylla-3.0-jessie.list', we deem it formal one
             if filename.startswith('scylla-') and filename.endswith('-{}.list'.format(dist_version)):
 
                 version_prefix = filename.replace('-{}.list'.format(dist_version), '').split('-')[-1]
-                _S3_SCYLLA_REPOS_CACHE[(
-                    dist_type, dist_version)][version_prefix] = "https://s3.amazonaws.com/{bucket}/{path}".format(bucket=bucket, path=repo_file['Key'])
+                repos_mapping[version_prefix] = "https://s3.amazonaws.com/{bucket}/{path}".format(
+                    bucket=bucket, path=repo_file['Key'])
 
     else:
         raise NotImplementedError("[{}] is not yet supported".format(dist_type))
-    return _S3_SCYLLA_REPOS_CACHE[(dist_type, dist_version)]
+    return repos_mapping
 
 
 def pid_exists(pid):
@@ -1106,6 +1223,9 @@ def safe_kill(pid, signal):
         return False
 
 
+FILE_FOLLOWER_READ_INTERVAL = 0.1  # seconds
+
+
 class FileFollowerIterator():  # pylint: disable=too-few-public-methods
     def __init__(self, filename, thread_obj):
         self.filename = filename
@@ -1115,14 +1235,11 @@ class FileFollowerIterator():  # pylint: disable=too-few-public-methods
         with open(self.filename, 'r') as input_file:
             line = ''
             while not self.thread_obj.stopped():
-                poller = select.poll()  # pylint: disable=no-member
-                poller.register(input_file, select.POLLIN)  # pylint: disable=no-member
-                if poller.poll(100):
-                    line += input_file.readline()
-                if not line or not line.endswith('\n'):
-                    time.sleep(0.1)
+                # Regular files are always reported as ready by poll(), so just read and wait for more data on EOF.
+                line += input_file.readline()
+                if not line.endswith('\n'):
+                    self.thread_obj.wait_stopped(timeout=FILE_FOLLOWER_READ_INTERVAL)
                     continue
-                poller.unregister(input_file)
                 yield line
                 line = ''
             yield line
@@ -1153,6 +1270,9 @@ class FileFollowerThread():
     def stopped(self):
         return self._stop_event.is_set()
 
+    def wait_stopped(self, timeout=None):
+        return self._stop_event.wait(timeout=timeout)
+
     def follow_file(self, filename):
         return FileFollowerIterator(filename, self)
 
@@ -1164,6 +1284,9 @@ class ScyllaCQLSession:
         self.verbose = verbose
 
     def __enter__(self):
+        if not self.verbose or not LOGGER.isEnabledFor(logging.DEBUG):
+            return self.session
+
         execute_orig = self.session.execute
 
         def execute_verbose(*args, **kwargs):
@@ -1171,11 +1294,10 @@ class ScyllaCQLSession:
                 query = args[0]
             else:
                 query = kwargs.get("query")
-            LOGGER.debug(f"Executing CQL '{query}'...")
+            LOGGER.debug("Executing CQL '%s'...", query)
             return execute_orig(*args, **kwargs)
 
-        if self.verbose:
-            self.session.execute = execute_verbose
+        self.session.execute = execute_verbose
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -1190,8 +1312,6 @@ class version():  # pylint: disable=invalid-name,too-few-public-methods
     VERSIONS = {}
     """
         Runs a method according to the version attribute of the class method
-        Limitations: currently, can't work if the same method name in the same file used in different
-                     classes
         Example:
                 In [3]: class VersionedClass(object):
                    ...:     def __init__(self, current_version):
@@ -1220,12 +1340,14 @@ class version():  # pylint: disable=invalid-name,too-few-public-methods
         self.version = ver
 
     def __call__(self, func):
-        self.VERSIONS[(self.version, func.__name__, func.__code__.co_filename)] = func
+        # All versions of a method share one {version: func} mapping, keyed by the qualified method name.
+        dispatch = self.VERSIONS.setdefault((func.__module__, func.__qualname__), {})
+        dispatch[self.version] = func
 
         @wraps(func)
         def inner(*args, **kwargs):
             cls_self = args[0]
-            func_to_run = self.VERSIONS.get((cls_self.version, func.__name__, func.__code__.co_filename))
+            func_to_run = dispatch.get(cls_self.version)
             if func_to_run:
                 return func_to_run(*args, **kwargs)
             else:
@@ -1237,20 +1359,15 @@ class version():  # pylint: disable=invalid-name,too-few-public-methods
 
 
 def get_free_port():
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.bind(('', 0))
-    addr = sock.getsockname()
-    port = addr[1]
-    sock.close()
-    return port
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('', 0))
+        return sock.getsockname()[1]
 
 
 def get_my_ip():
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.connect(("8.8.8.8", 80))
-    ip = sock.getsockname()[0]
-    sock.close()
-    return ip
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.connect(("8.8.8.8", 80))
+        return sock.getsockname()[0]
 
 
 @retrying(n=60, sleep_time=5, allowed_exceptions=(OSError, ))
@@ -1259,12 +1376,11 @@ def wait_for_port(host, port):
 
 
 def can_connect_to(ip: str, port: int, timeout: int = 1) -> bool:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.settimeout(timeout)
-    result = sock.connect_ex((ip, port))
-    sock.close()
-    return result == 0
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Reset the connection on close instead of leaving it in TIME_WAIT, the check can be run very often.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        sock.settimeout(timeout)
+        return sock.connect_ex((ip, port)) == 0
 
 
 def find_scylla_repo(scylla_version, dist_type='centos', dist_version=None):
@@ -1285,11 +1401,11 @@ def find_scylla_repo(scylla_version, dist_type='centos', dist_version=None):
 
     repo_map = get_s3_scylla_repos_mapping(dist_type, dist_version)
 
-    for key in repo_map:
-        if scylla_version.startswith(key):
-            return repo_map[key]
-    else:
+    # Take the longest matching prefix, so that e.g. '4.10.1' is matched to '4.10' and not to '4.1'.
+    key = max((key for key in repo_map if scylla_version.startswith(key)), key=len, default=None)
+    if key is None:
         raise ValueError(f"repo for scylla version {scylla_version} wasn't found")
+    return repo_map[key]
 
 
 def get_branched_repo(scylla_version: str,
@@ -1316,10 +1432,8 @@ def get_branched_repo(scylla_version: str,
     else:
         raise ValueError(f"Unsupported {dist_type=}")
 
-    s3_client: S3Client = boto3.client("s3", region_name=DEFAULT_AWS_REGION)
-    response = s3_client.list_objects(Bucket=bucket, Prefix=prefix, Delimiter='/')
-
-    for repo_file in response.get("Contents", ()):
+    s3_client: S3Client = get_boto3_client("s3", region_name=DEFAULT_AWS_REGION)
+    for repo_file in _s3_list_objects(s3_client, Bucket=bucket, Prefix=prefix, Delimiter='/'):
         if os.path.basename(repo_file['Key']) == filename:
             return f"https://s3.amazonaws.com/{bucket}/{repo_file['Key']}"
 
@@ -1338,7 +1452,7 @@ def get_branched_ami(ami_version, region_name):
     :return: list of ec2.images
     """
     branch, build_id = ami_version.split(':', 1)
-    ec2_resource: EC2ServiceResource = boto3.resource('ec2', region_name=region_name)
+    ec2_resource: EC2ServiceResource = get_boto3_resource('ec2', region_name=region_name)
 
     LOGGER.info("Looking for AMI match [%s]", ami_version)
     if build_id in ('latest', 'all'):
@@ -1357,10 +1471,24 @@ def get_branched_ami(ami_version, region_name):
         return amis[:1]
 
 
+@lru_cache(maxsize=None)
+def get_ami_details(ami_id: str, region_name: str) -> dict:
+    """
+    Get details of a specific AMI as returned by DescribeImages
+
+    Details are shared by all AMI lookups (owner, tags, root device) and cached, since they don't change during
+    a run.  The only exception are tags, the cache is cleared by tag_ami().
+
+    :param ami_id:
+    :param region_name: the region to look AMIs in
+    :return: dict of AMI details
+    """
+    client: EC2Client = get_boto3_client('ec2', region_name=region_name)
+    return client.describe_images(ImageIds=[ami_id])['Images'][0]
+
+
 def ami_built_by_scylla(ami_id: str, region_name: str) -> bool:
-    ec2_resource = boto3.resource("ec2", region_name=region_name)
-    image = ec2_resource.Image(ami_id)
-    return image.owner_id == SCYLLA_AMI_OWNER_ID
+    return get_ami_details(ami_id, region_name).get('OwnerId') == SCYLLA_AMI_OWNER_ID
 
 
 def get_ami_tags(ami_id, region_name):
@@ -1371,21 +1499,16 @@ def get_ami_tags(ami_id, region_name):
     :param region_name: the region to look AMIs in
     :return: dict of tags
     """
-    ec2_resource: EC2ServiceResource = boto3.resource('ec2', region_name=region_name)
-    test_image = ec2_resource.Image(ami_id)
-    if test_image.tags:
-        return {i['Key']: i['Value'] for i in test_image.tags}
-    else:
-        return {}
+    return {i['Key']: i['Value'] for i in get_ami_details(ami_id, region_name).get('Tags', [])}
 
 
 def tag_ami(ami_id, tags_dict, region_name):
     tags = [{'Key': key, 'Value': value} for key, value in tags_dict.items()]
+    tags += get_ami_details(ami_id, region_name).get('Tags', [])
 
-    ec2_resource: EC2ServiceResource = boto3.resource('ec2', region_name=region_name)
-    test_image = ec2_resource.Image(ami_id)
-    tags += test_image.tags
-    test_image.create_tags(Tags=tags)
+    client: EC2Client = get_boto3_client('ec2', region_name=region_name)
+    client.create_tags(Resources=[ami_id], Tags=tags)
+    get_ami_details.cache_clear()
 
     LOGGER.info("tagged %s with %s", ami_id, tags)
 
@@ -1400,11 +1523,8 @@ def get_db_tables(session, ks, with_compact_storage=True):
 
     """
     output = []
-    for table in session.cluster.metadata.keyspaces[ks].tables.keys():
-        table_code = session.cluster.metadata.keyspaces[ks].tables[table].as_cql_query()
-        if with_compact_storage is None:
-            output.append(table)
-        elif ("with compact storage" in table_code.lower()) == with_compact_storage:
+    for table, table_metadata in session.cluster.metadata.keyspaces[ks].tables.items():
+        if with_compact_storage is None or table_metadata.is_compact_storage == with_compact_storage:
             output.append(table)
     return output
 
@@ -1476,26 +1596,36 @@ def s3_download_dir(bucket, path, target):
     :param target: the local directory to download the files to.
     """
 
-    client: S3Client = boto3.client('s3', region_name=DEFAULT_AWS_REGION)
+    client: S3Client = get_boto3_client('s3', region_name=DEFAULT_AWS_REGION)
 
     # Handle missing / at end of prefix
     if not path.endswith('/'):
         path += '/'
     if path.startswith('/'):
         path = path[1:]
-    result = client.list_objects_v2(Bucket=bucket, Prefix=path)
-    # Download each file individually
-    for key in result['Contents']:
-        # Calculate relative path
-        rel_path = key['Key'][len(path):]
-        # Skip paths ending in /
-        if not key['Key'].endswith('/'):
-            local_file_path = os.path.join(target, rel_path)
-            # Make sure directories exist
-            local_file_dir = os.path.dirname(local_file_path)
-            os.makedirs(local_file_dir, exist_ok=True)
-            LOGGER.info("Downloading %s from s3 to %s", key['Key'], local_file_path)
-            _s3_download_file(client, bucket, key['Key'], local_file_path)
+    # Download files in parallel, most of the time is spent on per-request latency for small files.
+    with ThreadPoolExecutor(max_workers=S3_DOWNLOAD_DIR_WORKERS, thread_name_prefix="S3DownloadThread") as executor:
+        downloads = []
+        for key in _s3_list_objects(client, Bucket=bucket, Prefix=path):
+            # Calculate relative path
+            rel_path = key['Key'][len(path):]
+            # Skip paths ending in /
+            if not key['Key'].endswith('/'):
+                local_file_path = os.path.join(target, rel_path)
+                # Make sure directories exist
+                local_file_dir = os.path.dirname(local_file_path)
+                os.makedirs(local_file_dir, exist_ok=True)
+                LOGGER.info("Downloading %s from s3 to %s", key['Key'], local_file_path)
+                downloads.append(executor.submit(_s3_download_file, client, bucket, key['Key'], local_file_path))
+        for download in concurrent.futures.as_completed(downloads):
+            download.result()
+
+
+def _get_gcs_driver(gcp_credentials):
+    gcs_driver = libcloud.storage.providers.get_driver(libcloud.storage.types.Provider.GOOGLE_STORAGE)
+    return gcs_driver(gcp_credentials["project_id"] + "@appspot.gserviceaccount.com",
+                      gcp_credentials["private_key"],
+                      project=gcp_credentials["project_id"])
 
 
 def gce_download_dir(bucket, path, target):
@@ -1508,27 +1638,36 @@ def gce_download_dir(bucket, path, target):
 
     from sdcm.keystore import KeyStore
     gcp_credentials = KeyStore().get_gcp_credentials()
-    gce_driver = libcloud.storage.providers.get_driver(libcloud.storage.types.Provider.GOOGLE_STORAGE)
-
-    driver = gce_driver(gcp_credentials["project_id"] + "@appspot.gserviceaccount.com",
-                        gcp_credentials["private_key"],
-                        project=gcp_credentials["project_id"])
+    driver = _get_gcs_driver(gcp_credentials)
 
     if not path.endswith('/'):
         path += '/'
     if path.startswith('/'):
         path = path[1:]
 
+    # libcloud drivers aren't thread-safe, so every download thread uses a driver of its own.
+    thread_local = threading.local()
+
+    def download(obj, local_file_path):
+        if not hasattr(thread_local, "driver"):
+            thread_local.driver = _get_gcs_driver(gcp_credentials)
+        obj.driver = thread_local.driver
+        obj.download(destination_path=local_file_path, overwrite_existing=True)
+
     container = driver.get_container(container_name=bucket)
     dir_listing = driver.list_container_objects(container, ex_prefix=path)
-    for obj in dir_listing:
-        rel_path = obj.name[len(path):]
-        local_file_path = os.path.join(target, rel_path)
+    with ThreadPoolExecutor(max_workers=GCE_DOWNLOAD_DIR_WORKERS, thread_name_prefix="GCEDownloadThread") as executor:
+        downloads = []
+        for obj in dir_listing:
+            rel_path = obj.name[len(path):]
+            local_file_path = os.path.join(target, rel_path)
 
-        local_file_dir = os.path.dirname(local_file_path)
-        os.makedirs(local_file_dir, exist_ok=True)
-        LOGGER.info("Downloading %s from gcp to %s", obj.name, local_file_path)
-        obj.download(destination_path=local_file_path, overwrite_existing=True)
+            local_file_dir = os.path.dirname(local_file_path)
+            os.makedirs(local_file_dir, exist_ok=True)
+            LOGGER.info("Downloading %s from gcp to %s", obj.name, local_file_path)
+            downloads.append(executor.submit(download, obj, local_file_path))
+        for download_future in concurrent.futures.as_completed(downloads):
+            download_future.result()
 
 
 def download_dir_from_cloud(url):
@@ -1563,68 +1702,35 @@ def download_dir_from_cloud(url):
     return tmp_dir
 
 
+# Checked in this order, the first token found in the name decides the node type.
+NODE_TYPE_NAME_TOKENS = (
+    ("db-node", "db_nodes"),
+    ("monitor-node", "monitor_nodes"),
+    ("loader-node", "loader_nodes"),
+    ("-k8s-", "kubernetes_nodes"),
+)
+
+
+def _filter_by_type(objects, get_name):
+    filtered_objects = {node_type: [] for _, node_type in NODE_TYPE_NAME_TOKENS}
+    for obj in objects:
+        name = get_name(obj)
+        node_type = next((node_type for token, node_type in NODE_TYPE_NAME_TOKENS if token in name), None)
+        if node_type:
+            filtered_objects[node_type].append(obj)
+    return filtered_objects
+
+
 def filter_aws_instances_by_type(instances):
-    filtered_instances = {
-        "db_nodes": [],
-        "loader_nodes": [],
-        "monitor_nodes": [],
-        "kubernetes_nodes": [],
-    }
-
-    for instance in instances:
-        name = [tag['Value']
-                for tag in instance['Tags'] if tag['Key'] == 'Name']
-        if 'db-node' in name[0]:
-            filtered_instances["db_nodes"].append(instance)
-        if 'monitor-node' in name[0]:
-            filtered_instances["monitor_nodes"].append(instance)
-        if 'loader-node' in name[0]:
-            filtered_instances["loader_nodes"].append(instance)
-        elif '-k8s-' in name[0]:
-            filtered_instances["kubernetes_nodes"].append(instance)
-
-    return filtered_instances
+    return _filter_by_type(instances, lambda instance: _aws_tag_value(instance, "Name", ""))
 
 
 def filter_gce_instances_by_type(instances):
-    filtered_instances = {
-        "db_nodes": [],
-        "loader_nodes": [],
-        "monitor_nodes": [],
-        "kubernetes_nodes": [],
-    }
-
-    for instance in instances:
-        if 'db-node' in instance.name:
-            filtered_instances["db_nodes"].append(instance)
-        elif 'monitor-node' in instance.name:
-            filtered_instances["monitor_nodes"].append(instance)
-        elif 'loader-node' in instance.name:
-            filtered_instances["loader_nodes"].append(instance)
-        elif '-k8s-' in instance.name:
-            filtered_instances["kubernetes_nodes"].append(instance)
-
-    return filtered_instances
+    return _filter_by_type(instances, lambda instance: instance.name)
 
 
 def filter_docker_containers_by_type(containers):
-    filtered_containers = {
-        "db_nodes": [],
-        "loader_nodes": [],
-        "monitor_nodes": [],
-        "kubernetes_nodes": [],
-    }
-
-    for container in containers:
-        if "db-node" in container.name:
-            filtered_containers["db_nodes"].append(container)
-        elif "monitor-node" in container.name:
-            filtered_containers["monitor_nodes"].append(container)
-        elif "loader-node" in container.name:
-            filtered_containers["loader_nodes"].append(container)
-        elif '-k8s-' in container.name:
-            filtered_containers["kubernetes_nodes"].append(container)
-    return filtered_containers
+    return _filter_by_type(containers, lambda container: container.name)
 
 
 SSH_KEY_DIR = "~/.ssh"
@@ -1639,10 +1745,9 @@ def get_aws_builders(tags=None, running=False):
     aws_builders = list_instances_aws(tags_dict=tags, running=running)
 
     for aws_builder in aws_builders:
-        builder_name = [tag["Value"] for tag in aws_builder["Tags"] if tag["Key"] == "Name"][0]
         builders.append({"builder": {
             "public_ip": aws_builder["PublicIpAddress"],
-            "name": builder_name,
+            "name": _aws_tag_value(aws_builder, "Name"),
             "user": "jenkins",
             "key_file": os.path.expanduser(ssh_key_path)
         }})
@@ -1669,10 +1774,12 @@ def get_gce_builders(tags=None, running=False):
 
 def list_builders(running=False):
     builder_tag = {"NodeType": "Builder"}
-    aws_builders = get_aws_builders(builder_tag, running=running)
-    gce_builders = get_gce_builders(builder_tag, running=running)
 
-    return aws_builders + gce_builders
+    # AWS and GCE listings are independent, so don't wait for one before querying the other.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ListBuildersThread") as executor:
+        aws_builders = executor.submit(get_aws_builders, builder_tag, running=running)
+        gce_builders = executor.submit(get_gce_builders, builder_tag, running=running)
+        return aws_builders.result() + gce_builders.result()
 
 
 def get_builder_by_test_id(test_id):
@@ -1688,8 +1795,8 @@ def get_builder_by_test_id(test_id):
             builder['public_ip'], user=builder["user"], key_file=builder["key_file"])
 
         LOGGER.info('Search on %s', builder['name'])
-        result = remoter.run("find {where} -name test_id | xargs grep -rl {test_id}".format(where=base_path_on_builder,
-                                                                                            test_id=test_id),
+        # test_id files are plain files, so no need for recursive grep, and with no files found it would search CWD.
+        result = remoter.run(f"find {base_path_on_builder} -name test_id | xargs -r grep -lF {test_id}",
                              ignore_status=True, verbose=False)
 
         if not result.exited and result.stdout:
@@ -1702,6 +1809,8 @@ def get_builder_by_test_id(test_id):
             }
         else:
             LOGGER.info("Nothing found")
+            # only the remoter of the builder with the test run is used later, don't keep the others connected
+            remoter.stop()
             return None
 
     search_obj = ParallelObject(builders, timeout=30, num_workers=len(builders))
@@ -1713,18 +1822,16 @@ def get_builder_by_test_id(test_id):
     return found_builders
 
 
-def get_post_behavior_actions(config):
-    action_per_type = {
-        "db_nodes": {"NodeType": "scylla-db", "action": None},
-        "monitor_nodes": {"NodeType": "monitor", "action": None},
-        "loader_nodes": {"NodeType": "loader", "action": None},
-    }
+POST_BEHAVIOR_NODE_TYPES = {
+    "db_nodes": "scylla-db",
+    "monitor_nodes": "monitor",
+    "loader_nodes": "loader",
+}
 
-    for key in action_per_type:
-        config_key = 'post_behavior_{}'.format(key)
-        action_per_type[key]["action"] = config.get(config_key)
 
-    return action_per_type
+def get_post_behavior_actions(config):
+    return {key: {"NodeType": node_type, "action": config.get(f"post_behavior_{key}")}
+            for key, node_type in POST_BEHAVIOR_NODE_TYPES.items()}
 
 
 def clean_resources_according_post_behavior(params, config, logdir, dry_run=False):
@@ -1764,18 +1871,18 @@ def search_test_id_in_latest(logdir):
 
 
 def get_testrun_dir(base_dir, test_id=None):
-    from sdcm.remote import LocalCmdRunner
-
     if not test_id:
         test_id = search_test_id_in_latest(base_dir)
     LOGGER.info('Search dir with logs locally for test id: %s', test_id)
-    search_cmd = "find {base_dir} -name test_id | xargs grep -rl {test_id}".format(**locals())
-    result = LocalCmdRunner().run(cmd=search_cmd, ignore_status=True)
-    LOGGER.info("Search result %s", result)
-    if result.exited == 0 and result.stdout:
-        found_dirs = result.stdout.strip().split('\n')
-        LOGGER.info(found_dirs)
-        return os.path.dirname(found_dirs[0])
+    if test_id:
+        # Walk the tree in-process, test_id files are tiny and there's no need to spawn find and grep for them.
+        for dirpath, _, filenames in os.walk(base_dir):
+            if "test_id" not in filenames:
+                continue
+            with open(os.path.join(dirpath, "test_id")) as test_id_file:
+                if test_id in test_id_file.read():
+                    LOGGER.info("Found dir with logs: %s", dirpath)
+                    return dirpath
     LOGGER.info("No any dirs found locally for current test id")
     return None
 
@@ -1800,10 +1907,17 @@ def download_encrypt_keys():
     Download certificate files of encryption at-rest from S3 KeyStore
     """
     from sdcm.keystore import KeyStore
-    ks = KeyStore()
-    for pem_file in ['CA.pem', 'SCYLLADB.pem', 'hytrust-kmip-cacert.pem', 'hytrust-kmip-scylla.pem']:
-        if not os.path.exists('./data_dir/encrypt_conf/%s' % pem_file):
-            ks.download_file(pem_file, './data_dir/encrypt_conf/%s' % pem_file)
+    pem_files = ['CA.pem', 'SCYLLADB.pem', 'hytrust-kmip-cacert.pem', 'hytrust-kmip-scylla.pem']
+    pem_files = [pem_file for pem_file in pem_files if not os.path.exists('./data_dir/encrypt_conf/%s' % pem_file)]
+    if not pem_files:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(pem_files), thread_name_prefix="EncryptKeysDownloadThread") as executor:
+        # boto3 resources aren't thread-safe, so every file gets a KeyStore of its own, created in this thread.
+        downloads = [executor.submit(KeyStore().download_file, pem_file, './data_dir/encrypt_conf/%s' % pem_file)
+                     for pem_file in pem_files]
+        for download in downloads:
+            download.result()
 
 
 def normalize_ipv6_url(ip_address):
@@ -1814,15 +1928,15 @@ def normalize_ipv6_url(ip_address):
 
 
 def rows_to_list(rows):
-    return [list(row) for row in rows]
+    return list(map(list, rows))
 
 
 # Copied from dtest
 class Page:  # pylint: disable=too-few-public-methods
     data = None
 
-    def __init__(self):
-        self.data = []
+    def __init__(self, rows=()):
+        self.data = list(rows)
 
     def add_row(self, row):
         self.data.append(row)
@@ -1846,6 +1960,8 @@ class PageFetcher:
 
     def __init__(self, future):
         self.pages = []
+        # notified by driver callbacks on every page received
+        self._pages_retrieved = threading.Condition()
 
         # the first page is automagically returned (eventually)
         # so we'll count this as a request, but the retrieved count
@@ -1866,22 +1982,20 @@ class PageFetcher:
         self.wait(seconds=30)
 
     def handle_page(self, rows):
-        # occasionally get a final blank page that is useless
-        if rows == []:
-            self.retrieved_empty_pages += 1
-            return
-
-        page = Page()
-        self.pages.append(page)
-
-        for row in rows:
-            page.add_row(row)
-
-        self.retrieved_pages += 1
+        with self._pages_retrieved:
+            # occasionally get a final blank page that is useless
+            if rows == []:
+                self.retrieved_empty_pages += 1
+            else:
+                self.pages.append(Page(rows))
+                self.retrieved_pages += 1
+            self._pages_retrieved.notify_all()
 
     def handle_error(self, exc):
-        self.error = exc
-        raise exc
+        # called from the driver's thread, so only store the error and let wait() raise it in the caller's thread
+        with self._pages_retrieved:
+            self.error = exc
+            self._pages_retrieved.notify_all()
 
     def request_one(self):
         """
@@ -1890,8 +2004,9 @@ class PageFetcher:
         If the future is exhausted, this is a no-op.
         """
         if self.future.has_more_pages:
-            self.future.start_fetching_next_page()
+            # count the request first, the page can be handled before start_fetching_next_page() returns
             self.requested_pages += 1
+            self.future.start_fetching_next_page()
             self.wait()
 
         return self
@@ -1903,8 +2018,8 @@ class PageFetcher:
         If the future is exhausted, this is a no-op.
         """
         while self.future.has_more_pages:
-            self.future.start_fetching_next_page()
             self.requested_pages += 1
+            self.future.start_fetching_next_page()
             self.wait()
 
         return self
@@ -1915,7 +2030,7 @@ class PageFetcher:
 
         Requests are made by calling request_one and/or request_all.
 
-        Raises RuntimeError if seconds is exceeded.
+        Raises RuntimeError if seconds is exceeded, or the error the driver reported for a page request.
         """
         def error_message(msg):
             return "{}. Requested: {}; retrieved: {}; empty retrieved {}".format(
@@ -1926,16 +2041,15 @@ class PageFetcher:
             assert pages >= 0, error_message('Retrieved too many pages')
             return pages
 
-        missing = missing_pages()
-        if missing <= 0:
-            return self
-        expiry = time.time() + seconds * missing
-
-        while time.time() < expiry:
+        with self._pages_retrieved:
+            missing = missing_pages()
+            if missing > 0:
+                self._pages_retrieved.wait_for(lambda: self.error is not None or missing_pages() <= 0,
+                                               timeout=seconds * missing)
+            if self.error is not None:
+                raise self.error
             if missing_pages() <= 0:
                 return self
-            # small wait so we don't need excess cpu to keep checking
-            time.sleep(0.1)
 
         raise RuntimeError(error_message('Requested pages were not delivered before timeout'))
 
@@ -1970,11 +2084,7 @@ class PageFetcher:
 
         The page(s) should have already been requested with request_one and/or request_all.
         """
-        all_pages_combined = []
-        for page in self.pages:
-            all_pages_combined.extend(page.data[:])
-
-        return all_pages_combined
+        return list(itertools.chain.from_iterable(page.data for page in self.pages))
 
     @property  # make property to match python driver api
     def has_more_pages(self):
@@ -1984,11 +2094,11 @@ class PageFetcher:
         return self.future.has_more_pages
 
 
+@lru_cache(maxsize=None)
 def get_docker_stress_image_name(tool_name=None):
     if not tool_name:
         return None
-    base_path = os.path.dirname(os.path.dirname((os.path.dirname(__file__))))
-    with open(os.path.join(base_path, "docker", tool_name, "image"), "r") as image_file:
+    with open(os.path.join(get_sct_root_path(), "docker", tool_name, "image"), "r") as image_file:
         result = image_file.read()
 
     return result.strip()
@@ -2046,15 +2156,15 @@ def ec2_instance_wait_public_ip(instance):
 
 
 def ec2_ami_get_root_device_name(image_id, region):
-    ec2 = boto3.resource('ec2', region)
-    image = ec2.Image(image_id)
     try:
-        if image.root_device_name:
-            return image.root_device_name
-    except (TypeError, ClientError):
+        return get_ami_details(image_id, region).get('RootDeviceName')
+    except (IndexError, ClientError):
         raise AssertionError(f"Image '{image_id}' details not found in '{region}'")
 
 
+SnapshotDetails = namedtuple("SnapshotDetails", ["keyspace_name", "table_name"])
+
+
 def parse_nodetool_listsnapshots(listsnapshots_output: str) -> defaultdict:
     """
     listsnapshots output:
@@ -2069,11 +2179,10 @@ def parse_nodetool_listsnapshots(listsnapshots_output: str) -> defaultdict:
         Total TrueDiskSpaceUsed: 0 bytes
     """
     snapshots_content = defaultdict(list)
-    SnapshotDetails = namedtuple("SnapshotDetails", ["keyspace_name", "table_name"])
     for line in listsnapshots_output.splitlines():
-        if line and not line.startswith('Snapshot') and not line.startswith('Total'):
-            line_splitted = line.split()
-            snapshots_content[line_splitted[0]].append(SnapshotDetails(line_splitted[1], line_splitted[2]))
+        if line and not line.startswith(('Snapshot', 'Total')):
+            snapshot_name, keyspace_name, table_name = line.split(maxsplit=3)[:3]
+            snapshots_content[snapshot_name].append(SnapshotDetails(keyspace_name, table_name))
     return snapshots_content
 
 
@@ -2092,37 +2201,11 @@ def convert_metric_to_ms(metric: str) -> float:
     return metric_converted
 
 
-def _shorten_alpha_sequences(value: str, max_alpha_chunk_size: int) -> str:
-    if not value:
-        return value
-    is_alpha = value[0].isalpha()
-    num = 0
-    output = ''
-    for char in value:
-        if is_alpha == char.isalpha():
-            if is_alpha and num >= max_alpha_chunk_size:
-                continue
-            num += 1
-            output += char
-            continue
-        output += char
-        num = 1
-    return output
-
-
-def _shorten_sequences_in_string(value: Union[str, List[str]], max_alpha_chunk_size: int) -> str:
-    chunks = []
-    if isinstance(value, str):
-        tmp = value.split('-')
-    else:
-        tmp = value
-    for chunk in tmp:
-        chunks.append(_shorten_alpha_sequences(chunk, max_alpha_chunk_size))
-    return '-'.join(chunks)
+ALPHA_SEQUENCE_REGEX = re.compile(r"[A-Za-z]+")
 
 
-def _string_max_chunk_size(value):
-    return max([len(chunk) for chunk in value.split('-')])
+def _shorten_alpha_sequences(value: str, max_alpha_chunk_size: int) -> str:
+    return ALPHA_SEQUENCE_REGEX.sub(lambda match: match.group()[:max_alpha_chunk_size], value)
 
 
 def shorten_cluster_name(name: str, max_string_len: int):
@@ -2131,23 +2214,30 @@ def shorten_cluster_name(name: str, max_string_len: int):
     If it can't make it that short, it will return original name
     Shortening is done in following manner:
     1. It split string by '-' and take out and preserve last chunk (supposedly short test id there)
-    2. Array of chunks that is left it splits into sequences of digits and non-digits
-    3. Next it goes over non-digit chunks and trims them from right side by 1 char
-    4. On each trimming round it recombine name back in exact same order
-    5. Check if resulted string has len less than max_string_len and return it if it does
-    6. If trimming is not possible anymore it return original name
+    2. In the rest of the name it trims all sequences of letters to the same size from right side
+    3. It takes the biggest size for which resulted string has len not more than max_string_len
+    4. If trimming is not possible anymore it return original name
 
     Example:
         original name - longevity-scylla-operator-3h-gke-je-k8s-gke-cd86ad2b
         shorten name - lon-scy-ope-3h-gke-je-k8s-gke-cd86ad2b
     """
-    max_alpha_chunk_size = _string_max_chunk_size(name)
-    last_chunk = name.split('-')[-1]
-    current = '-'.join(name.split('-')[0:-1])
-    last_chunk_len = len(last_chunk)
-    while len(current) + last_chunk_len + 1 > max_string_len and max_alpha_chunk_size > 0:
-        current = _shorten_sequences_in_string(name.split('-')[0:-1], max_alpha_chunk_size)
-        max_alpha_chunk_size -= 1
-    if max_alpha_chunk_size == 0:
+    if len(name) <= max_string_len:
+        return name
+    current, _, last_chunk = name.rpartition('-')
+    max_len = max_string_len - len(last_chunk) - 1
+
+    # The length only grows with the chunk size, so look for the biggest chunk size which fits.
+    low, high = 1, max((len(chunk) for chunk in current.split('-')), default=0)
+    shortest = None
+    while low <= high:
+        max_alpha_chunk_size = (low + high) // 2
+        shortened = _shorten_alpha_sequences(current, max_alpha_chunk_size)
+        if len(shortened) <= max_len:
+            shortest = shortened
+            low = max_alpha_chunk_size + 1
+        else:
+            high = max_alpha_chunk_size - 1
+    if shortest is None:
         return name
-    return '-'.join([current, last_chunk])
+    return '-'.join([shortest, last_chunk])
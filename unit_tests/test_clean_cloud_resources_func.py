@@ -25,7 +25,7 @@ SCT_RUNNER_AWS = {
 }
 
 
-@patch("boto3.client")
+@patch("sdcm.utils.common.get_boto3_client")
 class CleanInstanceAwsTest(unittest.TestCase):
     def test_empty_tags_dict(self, _):
         self.assertRaisesRegex(AssertionError, "not provided", clean_instances_aws, {})
@@ -51,7 +51,7 @@ class CleanInstanceAwsTest(unittest.TestCase):
         ec2_client().terminate_instances.assert_called_once_with(InstanceIds=["i-1111"])
 
 
-@patch("boto3.client")
+@patch("sdcm.utils.common.get_boto3_client")
 class CleanElasticIpsAws(unittest.TestCase):
     def test_empty_tags_dict(self, _):
         self.assertRaisesRegex(AssertionError, "not provided", clean_elastic_ips_aws, {})
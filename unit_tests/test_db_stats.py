@@ -0,0 +1,84 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2020 ScyllaDB
+
+import unittest
+
+from sdcm.db_stats import STRESS_CMD_PARSERS, get_stress_cmd_params
+
+
+class TestGetStressCmdParams(unittest.TestCase):
+    def test_write_cmd(self):
+        cmd = "cassandra-stress write no-warmup cl=QUORUM duration=10m " \
+              "-schema 'replication(factor=3)' -port jmx=6868 -mode cql3 native " \
+              "-rate threads=100 throttle=10000/s -pop seq=1..10000000"
+        self.assertEqual(get_stress_cmd_params(cmd), {
+            "raw_cmd": cmd,
+            "command": "write",
+            "no-warmup": True,
+            "cl": "QUORUM",
+            "duration": "10m",
+            "rate threads": "100",
+            "throttle threads": "10000",
+            "schema": "replication(factor=3)",
+            "port": "jmx=6868",
+            "mode": "cql3 native",
+            "pop": "seq=1..10000000",
+        })
+
+    def test_n_inside_col_option(self):
+        cmd = "cassandra-stress write cl=ONE n=1000 -col 'size=FIXED(1024) n=FIXED(1)' -rate threads=200"
+        cmd_params = get_stress_cmd_params(cmd)
+        self.assertEqual(cmd_params["n"], "1000")
+        self.assertEqual(cmd_params["col"], "size=FIXED(1024) n=FIXED(1)")
+
+    def test_no_n_in_command_section(self):
+        cmd = "cassandra-stress write cl=ONE duration=5m -col 'size=FIXED(1024) n=FIXED(1)' -rate threads=200"
+        cmd_params = get_stress_cmd_params(cmd)
+        self.assertNotIn("n", cmd_params)
+        self.assertEqual(cmd_params["duration"], "5m")
+        self.assertEqual(cmd_params["rate threads"], "200")
+
+    def test_user_profile_cmd(self):
+        cmd = "cassandra-stress user profile=/tmp/cs_profile.yaml ops'(insert=1)' cl=QUORUM n=2000000 " \
+              "-rate fixed=1000/s threads=10"
+        cmd_params = get_stress_cmd_params(cmd)
+        self.assertEqual(cmd_params["command"], "user")
+        self.assertEqual(cmd_params["profile"], "/tmp/cs_profile.yaml")
+        self.assertEqual(cmd_params["ops"], "insert")
+        self.assertEqual(cmd_params["n"], "2000000")
+        self.assertEqual(cmd_params["fixed threads"], "1000")
+        self.assertEqual(cmd_params["rate threads"], "10")
+
+    def test_spaces_around_equal_sign(self):
+        cmd = "cassandra-stress write cl = QUORUM n= 1000 duration =10m -rate threads=10"
+        cmd_params = get_stress_cmd_params(cmd)
+        self.assertEqual(cmd_params["cl"], "QUORUM")
+        self.assertEqual(cmd_params["n"], "1000")
+        self.assertEqual(cmd_params["duration"], "10m")
+        self.assertEqual(cmd_params["rate threads"], "10")
+
+    def test_unbalanced_quote(self):
+        cmd = "cassandra-stress write cl=QUORUM n=1000 -col 'size=FIXED(1024) -rate threads=10"
+        cmd_params = get_stress_cmd_params(cmd)
+        self.assertEqual(cmd_params["cl"], "QUORUM")
+        self.assertEqual(cmd_params["n"], "1000")
+        self.assertEqual(cmd_params["col"], "size=FIXED(1024)")
+        self.assertEqual(cmd_params["rate threads"], "10")
+
+    def test_unknown_command(self):
+        cmd = "cassandra-stress version"
+        self.assertEqual(get_stress_cmd_params(cmd), {"raw_cmd": cmd})
+
+    def test_stress_cmd_parsers(self):
+        cmd = "cassandra-stress read cl=ONE n=10"
+        self.assertEqual(STRESS_CMD_PARSERS["cassandra-stress"](cmd)["n"], "10")
@@ -0,0 +1,105 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2020 ScyllaDB
+
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+from sdcm.stress_thread import CassandraStressExitWatchdog
+
+
+CS_RESULTS = """\
+Results:
+Op rate                   :   40,000 op/s  [WRITE: 40,000 op/s]
+Latency mean              :    1.2 ms [WRITE: 1.2 ms]
+Total operation time      : 00:01:00
+"""
+
+CS_AUTO_RUN_LOG = f"""\
+Running with 4 threadCount
+{CS_RESULTS}
+Running with 8 threadCount
+{CS_RESULTS}
+Improvement over 4 threadCount: 20%
+Running with 16 threadCount
+{CS_RESULTS}
+Improvement over 8 threadCount: 3%
+"""
+
+
+class TestCassandraStressExitWatchdog(unittest.TestCase):
+    grace_period = 0.5
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cs_log_filename = os.path.join(self.temp_dir, "cassandra-stress.log")
+        self.node = unittest.mock.MagicMock()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_log(self, content):
+        with open(self.cs_log_filename, "a") as cs_log:
+            cs_log.write(content)
+
+    def watchdog(self, stress_cmd):
+        return CassandraStressExitWatchdog(node=self.node, cs_log_filename=self.cs_log_filename,
+                                           run_marker="RUN_MARKER", stress_cmd=stress_cmd,
+                                           grace_period=self.grace_period)
+
+    def assert_killed(self, watchdog):
+        watchdog.future.result(timeout=5)
+        self.assertTrue(watchdog.killed)
+        self.node.remoter.run.assert_called_once_with(
+            cmd="pkill -9 -s $(ps -o sid= -p $(pgrep -o -f 'STRESS_RUN_MARKER=[R]UN_MARKER'))", ignore_status=True)
+
+    def test_kill_fixed_threads_run_hanging_after_results(self):
+        self.write_log(CS_RESULTS)
+        watchdog = self.watchdog("cassandra-stress write n=1000000 -rate threads=100")
+        with watchdog:
+            self.assert_killed(watchdog)
+
+    def test_no_kill_if_exited_in_grace_period(self):
+        self.write_log(CS_RESULTS)
+        watchdog = self.watchdog("cassandra-stress write duration=60m -rate threads=100")
+        with watchdog:
+            time.sleep(self.grace_period / 5)
+        watchdog.future.result(timeout=5)
+        self.assertFalse(watchdog.killed)
+        self.node.remoter.run.assert_not_called()
+
+    def test_no_kill_of_auto_threads_run_between_results(self):
+        self.write_log(CS_AUTO_RUN_LOG)
+        watchdog = self.watchdog("cassandra-stress write n=1000000 -mode cql3 native")
+        with watchdog:
+            time.sleep(self.grace_period * 3)
+            self.assertFalse(watchdog.killed)
+            self.node.remoter.run.assert_not_called()
+
+            self.write_log(f"{CS_RESULTS}\nEND\n")
+            self.assert_killed(watchdog)
+
+    def test_no_kill_of_duration_only_run_between_results(self):
+        self.write_log(CS_AUTO_RUN_LOG)
+        watchdog = self.watchdog("cassandra-stress write cl=QUORUM duration=60m -schema 'replication(factor=3)' "
+                                 "-mode cql3 native")
+        with watchdog:
+            time.sleep(self.grace_period * 3)
+            self.assertFalse(watchdog.killed)
+            self.node.remoter.run.assert_not_called()
+
+            self.write_log(f"{CS_RESULTS}\nEND\n")
+            self.assert_killed(watchdog)
@@ -12,15 +12,21 @@
 # Copyright (c) 2020 ScyllaDB
 
 import os
+import time
 import hashlib
 import shutil
 import logging
+import threading
 import unittest
 import unittest.mock
 from pathlib import Path
 
 from sdcm.utils.common import tag_ami
 from sdcm.utils.common import download_dir_from_cloud
+from sdcm.utils.common import verify_scylla_repo_file
+from sdcm.utils.common import find_scylla_repo
+from sdcm.utils.common import shorten_cluster_name
+from sdcm.utils.common import PageFetcher
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -70,3 +76,110 @@ class TestDownloadDir(unittest.TestCase):
         sct_update_db_packages = None
         update_db_packages = download_dir_from_cloud(sct_update_db_packages)
         assert update_db_packages is None
+
+
+class TestVerifyScyllaRepoFile(unittest.TestCase):
+    def test_rhel_repo_file(self):
+        verify_scylla_repo_file("[scylla]\nname=Scylla for Centos\nbaseurl=https://example.com/\n\n"
+                                "enabled=1\ngpgcheck=0\n")
+
+    def test_deb_list_file(self):
+        verify_scylla_repo_file("# Scylla\ndeb [arch=amd64] https://example.com/ stable main\n  \n",
+                                is_rhel_like=False)
+
+    def test_invalid_line(self):
+        self.assertRaisesRegex(AssertionError, "invalid line: <html>",
+                               verify_scylla_repo_file, "[scylla]\n<html>\n")
+        self.assertRaisesRegex(AssertionError, "invalid line: name=Scylla",
+                               verify_scylla_repo_file, "deb https://example.com/ stable main\nname=Scylla",
+                               is_rhel_like=False)
+
+
+class TestFindScyllaRepo(unittest.TestCase):
+    repos_mapping = {
+        "4.1": "https://example.com/scylla-4.1.repo",
+        "4.10": "https://example.com/scylla-4.10.repo",
+        "2020.1": "https://example.com/scylla-2020.1.repo",
+    }
+
+    def setUp(self):
+        patcher = unittest.mock.patch("sdcm.utils.common.get_s3_scylla_repos_mapping", return_value=self.repos_mapping)
+        self.get_s3_scylla_repos_mapping = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_longest_prefix(self):
+        self.assertEqual(find_scylla_repo("4.10.1"), "https://example.com/scylla-4.10.repo")
+        self.assertEqual(find_scylla_repo("4.1.3"), "https://example.com/scylla-4.1.repo")
+        self.get_s3_scylla_repos_mapping.assert_called_with("centos", None)
+
+    def test_not_found(self):
+        self.assertRaisesRegex(ValueError, "wasn't found", find_scylla_repo, "4.2.0", "ubuntu", "focal")
+
+
+class TestShortenClusterName(unittest.TestCase):
+    def test_short_name(self):
+        name = "longevity-test-cd86ad2b"
+        self.assertEqual(shorten_cluster_name(name, 40), name)
+
+    def test_shorten(self):
+        self.assertEqual(shorten_cluster_name("longevity-scylla-operator-3h-gke-je-k8s-gke-cd86ad2b", 40),
+                         "lon-scy-ope-3h-gke-je-k8s-gke-cd86ad2b")
+
+    def test_biggest_chunk_size_which_fits(self):
+        self.assertEqual(shorten_cluster_name("longevity-scylla-operator-3h-gke-je-k8s-gke-cd86ad2b", 41),
+                         "long-scyl-oper-3h-gke-je-k8s-gke-cd86ad2b")
+
+    def test_cant_shorten(self):
+        name = "longevity-scylla-operator-3h-gke-je-k8s-gke-cd86ad2b"
+        self.assertEqual(shorten_cluster_name(name, 20), name)
+
+
+class FakeResponseFuture:
+    """Deliver pages or an error from a separate thread, like the driver does."""
+
+    def __init__(self, pages, error=None):
+        self._pages = list(pages)
+        self._error = error
+        self._callback = None
+        self._errback = None
+
+    @property
+    def has_more_pages(self):
+        return bool(self._pages) or self._error is not None
+
+    def add_callbacks(self, callback, errback):
+        self._callback = callback
+        self._errback = errback
+        self.start_fetching_next_page()
+
+    def start_fetching_next_page(self):
+        def deliver():
+            time.sleep(0.1)
+            if self._pages:
+                self._callback(self._pages.pop(0))
+            else:
+                self._errback(self._error)
+        threading.Thread(target=deliver, daemon=True).start()
+
+
+
+class TestPageFetcher(unittest.TestCase):
+    def test_request_all(self):
+        fetcher = PageFetcher(FakeResponseFuture([[1, 2], [3, 4], [5], []]))
+        self.assertEqual(fetcher.pagecount(), 1)
+        fetcher.request_one()
+        self.assertEqual(fetcher.pagecount(), 2)
+        fetcher.request_all()
+        self.assertEqual(fetcher.pagecount(), 3)
+        self.assertEqual(fetcher.requested_pages, 4)
+        self.assertEqual(fetcher.retrieved_empty_pages, 1)
+        self.assertEqual(fetcher.num_results_all(), [2, 2, 1])
+
+    def test_error(self):
+        fetcher = PageFetcher(FakeResponseFuture([[1, 2]], error=ValueError("page request failed")))
+        self.assertEqual(fetcher.pagecount(), 1)
+        self.assertRaisesRegex(ValueError, "page request failed", fetcher.request_one)
+
+    def test_error_on_first_page(self):
+        self.assertRaisesRegex(ValueError, "page request failed",
+                               PageFetcher, FakeResponseFuture([], error=ValueError("page request failed")))